@@ -0,0 +1,124 @@
+"""
+Compare per-call latency of emp_db functions with a fresh connection per
+call (the old behavior) versus the pooled, long-lived connection.
+
+Runs against a temporary copy of employee.db so the real file is untouched.
+
+Usage:
+    python benchmarks/bench_db_pool.py [calls]
+"""
+
+import os
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+# Make python_crud modules importable
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "python_crud"))
+
+import db_pool
+import emp_db
+
+
+# ---------- Old Behavior (connect per call) ----------
+
+
+def search_fresh_connection(db_file, name):
+    conn = sqlite3.connect(db_file)
+    cursor = conn.cursor()
+    try:
+        return cursor.execute(
+            "SELECT emp_id, name, dob, user_type FROM employee WHERE name LIKE ?",
+            (f"%{name}%",),
+        ).fetchall()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def update_fresh_connection(db_file, emp_id, name):
+    conn = sqlite3.connect(db_file)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("UPDATE employee SET name = ? WHERE emp_id = ?", (name, emp_id))
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+# ---------- Timing Helpers ----------
+
+
+def time_calls(fn, calls):
+    """Run fn() `calls` times and return per-call latencies in microseconds."""
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2]
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:<32} mean={statistics.mean(samples):8.1f}us "
+        f"p50={p50:8.1f}us p95={p95:8.1f}us"
+    )
+    return statistics.mean(samples)
+
+
+# ---------- Main ----------
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_file = os.path.join(tmp_dir, "employee.db")
+        shutil.copy(os.path.join(ROOT, "employee.db"), db_file)
+        emp_db.DB_FILE = db_file
+
+        # Measure pooled connections, not the result cache
+        emp_db.configure_search_cache(max_size=0)
+
+        emp_id = emp_db.search_employees()[0][0]
+
+        print(f"{calls} calls per case\n")
+
+        before = report(
+            "search (connect per call)",
+            time_calls(lambda: search_fresh_connection(db_file, "Smith"), calls),
+        )
+        after = report(
+            "search (pooled)",
+            time_calls(lambda: emp_db.search_employees("Smith"), calls),
+        )
+        print(f"{'':<32} speedup x{before / after:.1f}\n")
+
+        before = report(
+            "update (connect per call)",
+            time_calls(lambda: update_fresh_connection(db_file, emp_id, "Bench A"), calls),
+        )
+        after = report(
+            "update (pooled)",
+            time_calls(
+                lambda: emp_db.update_employee(emp_id, "Bench B", None, 1), calls
+            ),
+        )
+        print(f"{'':<32} speedup x{before / after:.1f}")
+    finally:
+        db_pool.close_all()
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Reproducible benchmarks for the python_crud employee data-access layer.
+
+For every database size it measures:
+- search latency percentiles for each name/dob/user_type filter combination
+  (first page, the way the search form queries),
+- single-row insert/update and bulk insert throughput,
+- concurrent-reader throughput with 1, 2, 4 and 8 threads,
+- Reports window load time (pre-aggregated summary tables).
+
+Seeded databases are built once with python_sql/gen_employees.py and kept
+in --data-dir, so later runs only pay for the measurements. Writes run on a
+throwaway copy so the seeded database stays identical between runs.
+Results are printed and written as JSON for tracking regressions.
+
+Usage:
+    python benchmarks/bench_emp_db.py --sizes 10k,1m --out bench_emp_db.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "python_crud"))
+sys.path.append(os.path.join(ROOT, "python_sql"))
+
+import db_pool
+import emp_db
+import gen_employees
+import report_db
+
+SEED = 42
+SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+# Name filters typed by users: full last names, partial names, short prefixes
+NAME_SAMPLES = ["Smith", "Nguyen", "john", "atri", "Lee", "Ma", "J", "Garcia", "son"]
+
+
+def parse_size(text: str) -> int:
+    """'10k' -> 10000, '1m' -> 1000000, '500' -> 500."""
+    text = text.strip().lower()
+    if text[-1] in SIZE_SUFFIXES:
+        return int(float(text[:-1]) * SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def percentiles(samples_ms):
+    samples = sorted(samples_ms)
+
+    def pct(p):
+        return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+    return {
+        "count": len(samples),
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": pct(0.50),
+        "p90_ms": pct(0.90),
+        "p99_ms": pct(0.99),
+        "max_ms": samples[-1],
+    }
+
+
+# ---------- Database Setup ----------
+
+
+def seeded_db(data_dir, rows):
+    """Returns the path of a seeded database with `rows` employees."""
+    path = os.path.join(data_dir, f"employee_{rows}_seed{SEED}.db")
+    if not os.path.exists(path):
+        print(f"Seeding {rows:,} rows into {path} ...")
+        gen_employees.generate(
+            path + ".tmp", rows, SEED, workers=os.cpu_count() or 1, fast=True
+        )
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def use_db(path):
+    """Point emp_db at a database file and run any pending migrations."""
+    db_pool.close_all()
+    emp_db.DB_FILE = path
+    emp_db.search_employees_page(limit=1)  # Warm-up, not measured
+
+
+def sample_dobs(path, count, rng):
+    conn = sqlite3.connect(path)
+    max_id = conn.execute("SELECT MAX(emp_id) FROM employee").fetchone()[0]
+    dobs = []
+    while len(dobs) < count:
+        row = conn.execute(
+            "SELECT dob FROM employee WHERE emp_id = ?", (rng.randint(1, max_id),)
+        ).fetchone()
+        if row and row[0]:
+            dobs.append(date.fromisoformat(row[0]))
+    conn.close()
+    return dobs
+
+
+def filter_cases(path, queries, rng):
+    """
+    Build `queries` random filter tuples for every combination of
+    name / dob / user_type being set.
+    """
+    dobs = sample_dobs(path, queries, rng)
+    cases = {}
+    for use_name, use_dob, use_type in itertools.product((False, True), repeat=3):
+        label = "+".join(
+            part
+            for part, used in (("name", use_name), ("dob", use_dob), ("type", use_type))
+            if used
+        ) or "none"
+        cases[label] = [
+            (
+                rng.choice(NAME_SAMPLES) if use_name else None,
+                dobs[i] if use_dob else None,
+                rng.randint(1, 5) if use_type else None,
+            )
+            for i in range(queries)
+        ]
+    return cases
+
+
+# ---------- Measurements ----------
+
+
+def bench_search(cases):
+    results = {}
+    for label, filters in cases.items():
+        samples = []
+        for name, dob, user_type in filters:
+            start = time.perf_counter()
+            emp_db.search_employees_page(name, dob, user_type)
+            samples.append((time.perf_counter() - start) * 1000)
+        results[label] = percentiles(samples)
+        print(f"    search {label:<15} p50={results[label]['p50_ms']:7.2f}ms "
+              f"p99={results[label]['p99_ms']:7.2f}ms")
+    return results
+
+
+def bench_report(count=50):
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        report_db.load_report()
+        samples.append((time.perf_counter() - start) * 1000)
+    results = percentiles(samples)
+    print(f"    report load     p50={results['p50_ms']:7.2f}ms "
+          f"p99={results['p99_ms']:7.2f}ms")
+    return results
+
+
+def bench_writes(path, rows, count, rng):
+    """Insert/update throughput on a throwaway copy of the database."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        copy = os.path.join(tmp_dir, "employee.db")
+        shutil.copy(path, copy)
+        use_db(copy)
+
+        start = time.perf_counter()
+        for i in range(count):
+            emp_db.insert_employee(f"Bench Insert {i}", date(1990, 1, 1), 4)
+        insert_rate = count / (time.perf_counter() - start)
+
+        ids = [rng.randint(1, rows) for _ in range(count)]
+        start = time.perf_counter()
+        for emp_id in ids:
+            emp_db.update_employee(emp_id, "Bench Update", None, 2)
+        update_rate = count / (time.perf_counter() - start)
+
+        bulk_rows = count * 100
+        summary = emp_db.insert_employees(
+            (f"Bench Bulk {i}", None, 5) for i in range(bulk_rows)
+        )
+        db_pool.close_all()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    results = {
+        "insert_rows_per_sec": insert_rate,
+        "update_rows_per_sec": update_rate,
+        "bulk_insert_rows": bulk_rows,
+        "bulk_insert_rows_per_sec": summary["rows_per_sec"],
+    }
+    print(f"    insert {insert_rate:,.0f}/s  update {update_rate:,.0f}/s  "
+          f"bulk insert {summary['rows_per_sec']:,.0f}/s")
+    return results
+
+
+def bench_concurrent_readers(cases, seconds):
+    """Queries/sec with N threads searching at the same time."""
+    all_filters = [f for filters in cases.values() for f in filters]
+    results = {}
+    for threads in (1, 2, 4, 8):
+        stop = time.perf_counter() + seconds
+        counts = [0] * threads
+
+        def reader(slot):
+            rng = random.Random(SEED + slot)
+            while time.perf_counter() < stop:
+                emp_db.search_employees_page(*rng.choice(all_filters))
+                counts[slot] += 1
+            db_pool.close_connection(emp_db.DB_FILE)
+
+        workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        qps = sum(counts) / seconds
+        results[str(threads)] = {"queries_per_sec": qps}
+        print(f"    {threads} reader thread(s): {qps:,.0f} queries/sec")
+    return results
+
+
+# ---------- Main ----------
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the emp_db layer.")
+    parser.add_argument("--sizes", default="10k", help="comma list, e.g. 10k,1m,10m")
+    parser.add_argument("--queries", type=int, default=200, help="queries per filter combo")
+    parser.add_argument("--writes", type=int, default=500, help="single-row writes to time")
+    parser.add_argument("--reader-seconds", type=float, default=2.0)
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.join(tempfile.gettempdir(), "emp_db_bench"),
+        help="where seeded databases are cached",
+    )
+    parser.add_argument("--out", default="bench_emp_db.json", help="JSON results file")
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    # Measure the database, not the result cache
+    emp_db.configure_search_cache(max_size=0)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": SEED,
+        },
+        "results": {},
+    }
+
+    for size_text in args.sizes.split(","):
+        rows = parse_size(size_text)
+        path = seeded_db(args.data_dir, rows)
+        rng = random.Random(SEED)
+        print(f"\n== {rows:,} rows ==")
+
+        use_db(path)
+        cases = filter_cases(path, args.queries, rng)
+        report["results"][str(rows)] = {
+            "search": bench_search(cases),
+            "report": bench_report(),
+            "concurrent_readers": bench_concurrent_readers(cases, args.reader_seconds),
+            "writes": bench_writes(path, rows, args.writes, rng),
+        }
+        db_pool.close_all()
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
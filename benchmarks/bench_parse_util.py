@@ -0,0 +1,114 @@
+"""
+Benchmark parse_util's date parsing on a large column of date strings.
+
+Compares the old strptime-per-format loop with the fast paths:
+- parse_date() one string at a time (fixed-offset parser + memo cache),
+- parse_dates() on a list (format sniffing + per-column memo),
+- parse_dates() on a numpy array (pandas to_datetime), if pandas is installed.
+
+Two data sets: realistic birth dates (few distinct values, 10% US format)
+and all-distinct ISO dates (no repeats, so the caches can't help).
+
+Usage:
+    python benchmarks/bench_parse_util.py [--rows 1000000] [--seed 42]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+import parse_util
+
+
+def strptime_parse_date(s):
+    """The previous parse_date(): strptime per format, catching ValueError."""
+    if not s:
+        return None
+    s = s.strip()
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+    raise ValueError("Could not parse the given date.")
+
+
+def birth_dates(rows, rng):
+    """~20k distinct dates, 10% in US format, 5% empty."""
+    values = []
+    for _ in range(rows):
+        if rng.random() < 0.05:
+            values.append("")
+            continue
+        d = date(1955, 1, 1) + timedelta(days=rng.randrange(50 * 365))
+        values.append(d.strftime("%m/%d/%Y" if rng.random() < 0.1 else "%Y-%m-%d"))
+    return values
+
+
+def distinct_dates(rows):
+    start = date(1, 1, 1)
+    return [(start + timedelta(days=i)).isoformat() for i in range(rows)]
+
+
+def time_it(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def per_element(parse, values):
+    for s in values:
+        try:
+            parse(s)
+        except ValueError:
+            pass
+
+
+def bench(label, values):
+    print(f"\n{label}: {len(values):,} values, {len(set(values)):,} distinct")
+
+    # Start every run with a cold parse_date() cache
+    def cold(fn):
+        parse_util._parse_date_cached.cache_clear()
+        parse_util._column_date_cached.cache_clear()
+        return time_it(fn)
+
+    baseline = time_it(lambda: per_element(strptime_parse_date, values))
+    results = [
+        ("strptime loop (old parse_date)", baseline),
+        ("parse_date() per element", cold(lambda: per_element(parse_util.parse_date, values))),
+        ("parse_dates(list)", cold(lambda: parse_util.parse_dates(values))),
+        ("parse_dates(list, sniff=False)", cold(lambda: parse_util.parse_dates(values, sniff=False))),
+    ]
+    if parse_util.np is not None:
+        array = parse_util.np.array(values, dtype=object)
+        results.append(("parse_dates(numpy array)", cold(lambda: parse_util.parse_dates(array))))
+    else:
+        print("  (pandas not installed: skipping the array path)")
+
+    for name, seconds in results:
+        print(
+            f"  {name:<32} {seconds:7.2f}s {len(values) / seconds:>12,.0f}/s "
+            f"{baseline / seconds:6.1f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse_util date parsing.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bench("Birth dates", birth_dates(args.rows, rng))
+    bench("Distinct ISO dates", distinct_dates(args.rows))
+
+
+if __name__ == "__main__":
+    main()
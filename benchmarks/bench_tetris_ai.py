@@ -0,0 +1,59 @@
+"""
+Benchmark the Tetris AI: placements (boards evaluated) per second and
+pieces played per second, serially and with the process pool, for each
+lookahead depth. Every run plays the same seeded game.
+
+Usage:
+    python benchmarks/bench_tetris_ai.py [--pieces 200] [--depths 1 2 3] [--workers 4] [--seed 1]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "python_tkinter"))
+
+import tetris_ai
+import tetris_engine
+
+
+def bench(depth, workers, pieces, seed):
+    player = tetris_ai.AutoPlayer(depth=depth, workers=workers)
+    try:
+        engine = tetris_engine.TetrisEngine(seed=seed)
+        start = time.perf_counter()
+        tetris_engine.play_game(engine, player, max_pieces=pieces)
+        seconds = time.perf_counter() - start
+    finally:
+        player.close()
+    return engine, player.evaluated, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Tetris AI placement search.")
+    parser.add_argument("--pieces", type=int, default=200, help="pieces per run (depth 3+ plays a tenth)")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU(s); pool runs use {args.workers} worker(s)")
+    for depth in args.depths:
+        pieces = args.pieces if depth < 3 else max(1, args.pieces // 10)
+        runs = [("serial", 1)]
+        if depth >= 2 and args.workers > 1:
+            runs.append(("pool", args.workers))
+        for name, workers in runs:
+            engine, evaluated, seconds = bench(depth, workers, pieces, args.seed)
+            print(
+                f"  depth {depth} {name:<6} {evaluated / seconds:>10,.0f} placements/sec "
+                f"{engine.pieces / seconds:>9,.1f} pieces/sec  "
+                f"({engine.pieces} pieces, {engine.lines_cleared} lines"
+                f"{', game over' if engine.game_over else ''})"
+            )
+
+
+if __name__ == "__main__":
+    main()
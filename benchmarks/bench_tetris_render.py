@@ -0,0 +1,137 @@
+"""
+Benchmark Tetris frame rendering: the old full redraw (delete "all" and
+re-create every rectangle) against the incremental renderer (persistent
+cell items, only changed cells reconfigured).
+
+Both play the same seeded sequence of moves, rotations and gravity ticks
+on a withdrawn window, drawing after every input the way the game loop
+does once per frame; each frame is flushed with update_idletasks() so
+Tk's redisplay is included. Needs a display (Tk).
+
+Usage:
+    python benchmarks/bench_tetris_render.py [--frames 5000] [--seed 42]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "python_tkinter"))
+
+import tetris
+
+
+class CountingTk:
+    """Wraps a widget's Tcl interpreter to count the Tk calls it makes."""
+
+    def __init__(self, tk):
+        self._tk = tk
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def full_redraw(self):
+    """The previous Tetris.draw(): rebuild the whole board every frame."""
+    self.canvas.delete("all")
+    for r in range(self.ROWS):
+        for c in range(self.COLS):
+            x1 = c * self.CELL; y1 = r * self.CELL
+            x2 = x1 + self.CELL; y2 = y1 + self.CELL
+            self.canvas.create_rectangle(x1, y1, x2, y2, outline="#333", fill="#111")
+            if self.engine.cells[r][c]:
+                self.canvas.create_rectangle(x1 + 1, y1 + 1, x2 - 1, y2 - 1,
+                                             outline="", fill=self.COLORS[self.engine.cells[r][c]])
+    current = self.engine.current
+    t = current['type']
+    col = self.COLORS[t]
+    mat = self.shape_matrix(t, current['rot'])
+    for i, row in enumerate(mat):
+        for j, cell in enumerate(row):
+            if not cell:
+                continue
+            gx = current['x'] + j
+            gy = current['y'] + i
+            if 0 <= gx < self.COLS and 0 <= gy < self.ROWS:
+                x1 = gx * self.CELL; y1 = gy * self.CELL
+                x2 = x1 + self.CELL; y2 = y1 + self.CELL
+                self.canvas.create_rectangle(x1 + 1, y1 + 1, x2 - 1, y2 - 1,
+                                             outline="", fill=col)
+                if self.rotate_flash > 0:
+                    self.canvas.create_rectangle(x1 + 3, y1 + 3, x2 - 3, y2 - 3,
+                                                 outline="#FFF")
+
+
+def play(game, frames, seed):
+    """Drive the game with random inputs; returns (seconds, canvas Tk calls)."""
+    rng = random.Random(seed)
+    game.engine.rng.seed(seed)  # Same piece sequence for both renderers
+    game.restart()
+    counter = game.canvas.tk = CountingTk(game.canvas.tk)
+    actions = [
+        lambda: game.try_move(-1, 0),
+        lambda: game.try_move(1, 0),
+        lambda: game.rotate(+1),
+        game.soft_drop,
+        game.tick,
+        game.tick,
+    ]
+    start = time.perf_counter()
+    for _ in range(frames):
+        if game.game_over:
+            game.restart()
+        rng.choice(actions)()
+        # What Tetris.loop() does once per frame
+        if game.needs_draw:
+            game.needs_draw = False
+            game.draw()
+        game.root.update_idletasks()
+    seconds = time.perf_counter() - start
+    game.canvas.tk = counter._tk
+    return seconds, counter.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Tetris rendering.")
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    game = tetris.Tetris()
+    game.root.withdraw()
+    game.root.bell = lambda: None
+
+    new_seconds, new_calls = play(game, args.frames, args.seed)
+    stats = game.frame_stats()
+
+    game.draw = types.MethodType(full_redraw, game)
+    old_seconds, old_calls = play(game, args.frames, args.seed)
+    game.root.destroy()
+
+    print(f"{args.frames:,} frames")
+    for name, seconds, calls in (
+        ("full redraw (old)", old_seconds, old_calls),
+        ("incremental", new_seconds, new_calls),
+    ):
+        print(
+            f"  {name:<18} {seconds * 1000 / args.frames:7.3f} ms/frame "
+            f"{calls / args.frames:8.1f} canvas calls/frame"
+        )
+    print(f"  speedup            {old_seconds / new_seconds:7.1f}x")
+    print(
+        f"  incremental draw(): avg {stats['avg_ms']:.3f} ms, max {stats['max_ms']:.3f} ms, "
+        f"{stats['cells_per_frame']:.1f} cells updated per frame"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Compare render time of a plain ttk.Treeview (one tree.insert per row, the
+old update_tree behavior) with python_crud's VirtualTreeview.
+
+Needs a display (on a headless machine run it under xvfb-run).
+
+Usage:
+    python benchmarks/bench_virtual_tree.py [--sizes 1k,100k,1m] [--classic-max 100k]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "python_crud"))
+
+import virtual_tree
+
+COLUMNS = ("emp_id", "name", "dob", "user_type")
+
+
+def parse_size(text):
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1])
+    return int(float(text[:-1]) * scale) if scale else int(text)
+
+
+def make_rows(count):
+    return [(i, f"Employee {i}", "1990-01-01", i % 5 + 1) for i in range(1, count + 1)]
+
+
+def time_classic(root, rows):
+    """Old behavior: clear the tree, insert every row, draw."""
+    tree = ttk.Treeview(root, columns=COLUMNS, show="headings")
+    tree.pack(fill="both", expand=True)
+    root.update()
+
+    start = time.perf_counter()
+    tree.delete(*tree.get_children())
+    for row in rows:
+        tree.insert("", "end", values=row)
+    root.update()
+    elapsed = time.perf_counter() - start
+
+    tree.destroy()
+    return elapsed
+
+
+def time_virtual(root, rows):
+    """VirtualTreeview: set the data, draw, then scroll through 100 screens."""
+    view = virtual_tree.VirtualTreeview(root, COLUMNS)
+    view.pack(fill="both", expand=True)
+    root.update()
+
+    start = time.perf_counter()
+    view.set_data(rows)
+    root.update()
+    render = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        view.scroll_by(view.visible_rows)
+        root.update()
+    scroll = (time.perf_counter() - start) / 100
+
+    view.destroy()
+    return render, scroll
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Treeview rendering.")
+    parser.add_argument("--sizes", default="1k,100k,1m")
+    parser.add_argument(
+        "--classic-max", default="100k", help="skip the plain Treeview above this size"
+    )
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Cannot open a display ({e}). Try: xvfb-run python {sys.argv[0]}")
+        sys.exit(1)
+    root.geometry("800x480")
+
+    classic_max = parse_size(args.classic_max)
+    print(f"{'rows':>10} {'plain Treeview':>16} {'virtual render':>16} {'virtual scroll':>16}")
+    for size_text in args.sizes.split(","):
+        count = parse_size(size_text)
+        rows = make_rows(count)
+
+        classic = time_classic(root, rows) if count <= classic_max else None
+        render, scroll = time_virtual(root, rows)
+
+        classic_text = f"{classic * 1000:13.1f} ms" if classic is not None else "      (skipped)"
+        print(
+            f"{count:>10,} {classic_text:>16} {render * 1000:13.1f} ms "
+            f"{scroll * 1000:13.2f} ms"
+        )
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
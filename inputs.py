@@ -4,7 +4,9 @@
 # =========================
 
 from datetime import datetime
+from functools import lru_cache
 import re
+import sys
 import parse_util
 
 
@@ -36,6 +38,79 @@ def __input(var_name, type_converter=None, required=True, validator=None):
             failed = True
 
 
+# === LIST TOKENIZER ===
+#
+# Lists with escapes or quotes are split with one precompiled regex per
+# (delimiter, quote, escape) that matches a whole item at a time; plain lists
+# use str.split(). Either way a megabyte-sized list is tokenized in one
+# linear pass and parse_list() stops at the first invalid item without
+# converting the rest.
+#
+# - escape + delimiter is a literal delimiter ("a\,b" -> "a,b"); any other
+#   escape character is kept as is,
+# - with a quote character, a quoted item keeps its delimiters and spaces
+#   and "" inside it is a literal quote (CSV style),
+# - items are stripped; an empty item parses to None.
+
+@lru_cache(maxsize=None)
+def __list_pattern(delimiter, quote, escape):
+    if len(delimiter) != 1 or (quote and len(quote) != 1) or (escape and len(escape) != 1):
+        raise ValueError("delimiter, quote and escape must be single characters.")
+    d = re.escape(delimiter)
+    special = delimiter + (escape or "")
+    plain = f"[^{re.escape(special)}]+"
+    if escape:
+        plain += f"|{re.escape(escape)}{d}?"
+    if quote:
+        q = re.escape(quote)
+        quoted = f"[ \\t]*{q}((?:[^{q}]|{q}{q})*){q}[ \\t]*(?={d}|$)"
+    else:
+        quoted = "(?!)()"  # Never matches; keeps the group numbers the same
+    return re.compile(f"(?:{quoted}|((?:{plain})*))({d})?", re.DOTALL)
+
+
+def split_list(value_str, delimiter=",", quote=None, escape="\\"):
+    """Yields the stripped, unescaped items of a delimited list, lazily."""
+    pattern = __list_pattern(delimiter, quote, escape)
+
+    # Nothing to unescape or unquote: str.split() runs at C speed
+    if (not escape or escape not in value_str) and (not quote or quote not in value_str):
+        for item in value_str.split(delimiter):
+            yield item.strip()
+        return
+
+    escaped_delimiter = (escape or "") + delimiter
+    for match in pattern.finditer(value_str):
+        quoted, plain, separator = match.groups()
+        if quoted is not None:
+            yield quoted.replace(quote + quote, quote)
+        else:
+            item = plain.strip()
+            if escape and escape in item:
+                item = item.replace(escaped_delimiter, delimiter)
+            yield item
+        if separator is None:
+            return
+
+
+def parse_list(value_str, type_converter=None, validator=None, delimiter=",", quote=None, escape="\\"):
+    """
+    Yields the parsed items of a delimited list, lazily; empty items are None.
+    Raises ValueError at the first item that fails to convert or validate.
+    """
+    for index, item in enumerate(split_list(value_str, delimiter, quote, escape)):
+        if item == "":
+            parsed_val = None
+        else:
+            try:
+                parsed_val = item if type_converter is None else type_converter(item)
+            except Exception:
+                raise ValueError(f"Invalid item {index + 1}: {item!r}") from None
+        if validator is not None and not validator(parsed_val):
+            raise ValueError(f"Invalid item {index + 1}: {item!r}")
+        yield parsed_val
+
+
 # --- Core function to get and parse a comma-separated list ---
 def __input_list(var_name, type_converter=None, required=True, validator=None):
     failed = False
@@ -46,42 +121,14 @@ def __input_list(var_name, type_converter=None, required=True, validator=None):
 
         value_str = input(f">>> Enter {var_name}: ").strip()
 
-        # Split on unescaped commas
-        items = re.split(r"(?<!\\),", value_str)
-
         # Return empty list if optional and no input
         if not required and not value_str:
             return []
 
-        result = []
-        for item in items:
-            item = item.replace(r"\,", ",").strip()  # Unescape any escaped commas
-
-            try:
-                # Allow empty item to become None
-                if item == "":
-                    result.append(None)
-                else:
-                    parsed_val = item if type_converter is None else type_converter(item)
-                    result.append(parsed_val)
-            except Exception:
-                failed = True
-                break
-
-        if failed:
-            continue
-
-        # Validate each item if validator provided
-        if validator:
-            for parsed_val in result:
-                if not validator(parsed_val):
-                    failed = True
-                    break
-
-            if failed:
-                continue
-
-        return result
+        try:
+            return list(parse_list(value_str, type_converter, validator))
+        except ValueError:
+            failed = True
 
 
 # === SINGLE VALUE INPUTS ===
@@ -118,3 +165,152 @@ def input_bools(var_name, required=True, validator=None):
 
 def input_dates(var_name, required=True, validator=None):
     return __input_list(var_name, parse_util.parse_date, required, validator)
+
+
+# === RECORD INPUT ===
+
+def input_record(schema):
+    """
+    Prompt for every field of a record_schema.RecordSchema, then parse them
+    all with the compiled schema. Only the fields with errors are asked
+    again. Returns the tuple of parsed values, in field order.
+    """
+    parse = schema.compile()
+    record = {}
+    fields = schema.fields
+    while True:
+        for field in fields:
+            record[field.name] = input(f">>> Enter {field.label}: ")
+
+        values, errors = parse(record)
+        if not errors:
+            return values
+
+        for _, message in errors:
+            print(f"ERROR: {message}")
+        bad_names = {name for name, _ in errors}
+        fields = [field for field in schema.fields if field.name in bad_names]
+
+
+# === BATCH MODE ===
+#
+# Non-interactive counterparts of the inputs above for scripts driven by
+# files or pipes. Values come one per line from stdin, a file path, an open
+# file or any iterable of strings; they go through the same converters and
+# validators, but nothing is prompted or re-asked. Every function returns
+# (values, errors):
+# - values has one entry per line (None where the line was invalid),
+# - errors is a list of (line_number, text) for EVERY bad line.
+
+BATCH_ERRORS_SHOWN = 20  # print_batch_errors() prints only the first errors
+
+
+def read_lines(source=None):
+    """Returns the lines of source (stdin if None, a path, a file or an iterable)."""
+    if source is None:
+        source = sys.stdin
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as file:
+            return file.read().splitlines()
+    if hasattr(source, "read"):
+        return source.read().splitlines()
+    return list(source)
+
+
+# --- Core function to parse many single values ---
+def __batch(source, type_converter=None, required=True, validator=None):
+    texts = list(map(str.strip, read_lines(source)))
+
+    # Fast path: with no empty lines, convert and validate the whole batch at
+    # C speed; only a batch with a bad value pays for the per-line loop below
+    if "" not in texts:
+        try:
+            values = texts if type_converter is None else list(map(type_converter, texts))
+            if validator is None or all(map(validator, values)):
+                return values, []
+        except Exception:
+            pass
+
+    values = []
+    errors = []
+    for line_number, text in enumerate(texts, 1):
+        if text == "":
+            values.append(None)
+            if required:
+                errors.append((line_number, text))
+            continue
+        try:
+            parsed_val = text if type_converter is None else type_converter(text)
+            valid = validator is None or validator(parsed_val)
+        except Exception:
+            valid = False
+        if valid:
+            values.append(parsed_val)
+        else:
+            values.append(None)
+            errors.append((line_number, text))
+    return values, errors
+
+
+# --- Core function to parse many comma-separated lists, one per line ---
+def __batch_list(source, type_converter=None, required=True, validator=None):
+    values = []
+    errors = []
+    for line_number, line in enumerate(read_lines(source), 1):
+        value_str = line.strip()
+        if not value_str:
+            values.append([] if not required else None)
+            if required:
+                errors.append((line_number, line))
+            continue
+
+        try:
+            values.append(list(parse_list(value_str, type_converter, validator)))
+        except ValueError:
+            values.append(None)
+            errors.append((line_number, line))
+    return values, errors
+
+
+def print_batch_errors(var_name, errors):
+    """Prints the errors of a batch function, then a count of the rest."""
+    for line_number, text in errors[:BATCH_ERRORS_SHOWN]:
+        print(f"ERROR: Invalid {var_name} on line {line_number}: {text!r}")
+    if len(errors) > BATCH_ERRORS_SHOWN:
+        print(f"ERROR: ... and {len(errors) - BATCH_ERRORS_SHOWN:,} more invalid {var_name}.")
+
+
+# === BATCH SINGLE VALUES (one value per line) ===
+
+def batch_ints(source=None, required=True, validator=None):
+    return __batch(source, int, required, validator)
+
+def batch_floats(source=None, required=True, validator=None):
+    return __batch(source, float, required, validator)
+
+def batch_strings(source=None, required=True, validator=None):
+    return __batch(source, None, required, validator)
+
+def batch_bools(source=None, required=True, validator=None):
+    return __batch(source, parse_util.parse_bool, required, validator)
+
+def batch_dates(source=None, required=True, validator=None):
+    return __batch(source, parse_util.parse_date, required, validator)
+
+
+# === BATCH LISTS (one comma-separated list per line) ===
+
+def batch_int_lists(source=None, required=True, validator=None):
+    return __batch_list(source, int, required, validator)
+
+def batch_float_lists(source=None, required=True, validator=None):
+    return __batch_list(source, float, required, validator)
+
+def batch_string_lists(source=None, required=True, validator=None):
+    return __batch_list(source, None, required, validator)
+
+def batch_bool_lists(source=None, required=True, validator=None):
+    return __batch_list(source, parse_util.parse_bool, required, validator)
+
+def batch_date_lists(source=None, required=True, validator=None):
+    return __batch_list(source, parse_util.parse_date, required, validator)
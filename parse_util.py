@@ -1,9 +1,103 @@
 from datetime import datetime, date
+from functools import lru_cache, partial
+from numbers import Integral, Real
+
+# Optional: pandas (with numpy) lets the column parsers below accept and
+# return arrays. Without it they work on lists only.
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+    pd = None
+
+# Strings accepted by parse_bool
+TRUE_STRINGS = ("true", "yes", "y", "1", "on")
+FALSE_STRINGS = ("false", "no", "n", "0", "off")
 
 # ============================================================
 # DATE PARSING
 # ============================================================
 
+# Supported date formats, in the order they are tried
+DATE_FORMATS = (
+    "%Y-%m-%d",  # ISO format
+    "%m/%d/%Y",  # US format
+)
+
+DATE_ERROR = "Could not parse the given date. Expected format: YYYY-MM-DD or MM/DD/YYYY"
+
+# Distinct date strings remembered by parse_date(). Imports repeat the same
+# dates a lot (10M employees have only ~20k distinct birth dates).
+DATE_CACHE_SIZE = 65536
+
+
+def _fast_iso(s):
+    """'YYYY-MM-DD' by fixed offsets; None if s is not exactly that shape."""
+    # s[5] rules out ISO week dates ('2020-W01-1'), which fromisoformat
+    # accepts but strptime("%Y-%m-%d") does not
+    if len(s) == 10 and s[4] == "-" and s[7] == "-" and s[5].isdigit() and s.isascii():
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            return None  # e.g. month 13 or Feb 30
+    return None
+
+
+def _fast_us(s):
+    """'MM/DD/YYYY' by fixed offsets; None if s is not exactly that shape."""
+    if len(s) == 10 and s[2] == "/" and s[5] == "/" and s.isascii():
+        if (s[:2] + s[3:5]).isdigit():
+            try:
+                return datetime.fromisoformat(f"{s[6:]}-{s[:2]}-{s[3:5]}")
+            except ValueError:
+                return None
+    return None
+
+
+_FAST_DATE_PARSERS = {"%Y-%m-%d": _fast_iso, "%m/%d/%Y": _fast_us}
+
+
+def _parse_date_text(s, formats=DATE_FORMATS):
+    """
+    Parses stripped text, trying `formats` in order. The fixed-offset
+    parsers handle the usual zero-padded shapes without exceptions;
+    strptime only sees unusual input such as '1990-1-5'. The formats can't
+    both match one string, so the order only changes the speed.
+    """
+    for fmt in formats:
+        value = _FAST_DATE_PARSERS[fmt](s)
+        if value is not None:
+            return value
+
+    for fmt in formats:
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+
+    raise ValueError(DATE_ERROR)
+
+
+# parse_date() memo
+_parse_date_cached = lru_cache(maxsize=DATE_CACHE_SIZE)(_parse_date_text)
+
+
+def _column_date(s, formats=DATE_FORMATS):
+    """parse_dates() element parser: None instead of raising."""
+    if s.__class__ is not str:
+        return None
+    try:
+        return _parse_date_text(s.strip(), formats)
+    except ValueError:
+        return None
+
+
+# parse_dates() memo for columns in the default format order. It never
+# raises, so the whole column can go through map() at C speed.
+_column_date_cached = lru_cache(maxsize=DATE_CACHE_SIZE)(_column_date)
+
+
 def parse_date(s: str) -> datetime:
     """
     Parses a string into a datetime object.
@@ -13,19 +107,23 @@ def parse_date(s: str) -> datetime:
     if not s:
         return None
 
-    s = s.strip()
-    date_formats = [
-        "%Y-%m-%d",  # ISO format
-        "%m/%d/%Y"   # US format
-    ]
+    return _parse_date_cached(s.strip())
 
-    for fmt in date_formats:
-        try:
-            return datetime.strptime(s, fmt)
-        except ValueError:
-            continue
 
-    raise ValueError("Could not parse the given date. Expected format: YYYY-MM-DD or MM/DD/YYYY")
+def sniff_date_formats(values, sample_size: int = 100) -> tuple[str, ...]:
+    """
+    Returns DATE_FORMATS reordered so the format of the first parseable
+    value among the first sample_size values comes first. A column is
+    almost always written in one format, so misses become rare.
+    """
+    for s in values[:sample_size]:
+        if not isinstance(s, str):
+            continue
+        s = s.strip()
+        for fmt in DATE_FORMATS:
+            if _FAST_DATE_PARSERS[fmt](s) is not None:
+                return (fmt,) + tuple(f for f in DATE_FORMATS if f != fmt)
+    return DATE_FORMATS
 
 
 def date_or_none(s: str) -> datetime | None:
@@ -63,9 +161,9 @@ def parse_bool(s: str) -> bool:
         return None
 
     s = s.strip().lower()
-    if s in ("true", "yes", "y", "1", "on"):
+    if s in TRUE_STRINGS:
         return True
-    if s in ("false", "no", "n", "0", "off"):
+    if s in FALSE_STRINGS:
         return False
 
     raise ValueError("Could not convert the string to a boolean. Expected: true|false|yes|no|y|n|1|0|on|off")
@@ -190,3 +288,202 @@ def code_or_none(s: str) -> str | None:
         return None
     s = s.strip().upper()
     return s if s else None
+
+
+# ============================================================
+# COLUMN (BULK) PARSING
+# ============================================================
+#
+# parse_dates / parse_ints / parse_floats / parse_bools convert a whole
+# column at once and never raise per element. Each returns (values, valid):
+# - valid[i] is False if values_in[i] could not be parsed,
+# - empty input counts as valid and gives a missing value (like try_parse_*).
+# Values that are already numbers or booleans (including numeric/bool
+# numpy arrays and Series) are taken as they are instead of parsed as text,
+# except that booleans are not numbers here (like parse_int / parse_float).
+#
+# Lists (or any iterable) give Python lists back, with None for missing or
+# invalid entries. numpy arrays and pandas Series give back a pandas Series
+# (NaT / <NA> for missing or invalid entries) and a numpy bool array. The
+# Series always has a fresh 0..n-1 index, like the list positions and the
+# valid array, whatever the index of a Series passed in. Date arrays of
+# VECTORIZE_MIN_ROWS or more are parsed by pandas' vectorized to_datetime.
+
+# Below this many rows, pandas' per-call overhead outweighs to_datetime's
+# speed, so date arrays are parsed per element like lists
+VECTORIZE_MIN_ROWS = 2_000
+
+
+def _is_array(values) -> bool:
+    return pd is not None and isinstance(values, (np.ndarray, pd.Series))
+
+
+def _is_missing(s) -> bool:
+    """True for None, blank strings and NaN/NaT/NA from numpy or pandas."""
+    if isinstance(s, str):
+        return not s.strip()
+    if s is None or (pd is not None and s is pd.NA):
+        return True
+    return s != s  # NaN and NaT are not equal to themselves
+
+
+def _parse_column(values, parse) -> tuple[list, list[bool]]:
+    """Plain Python fallback: parse one element at a time."""
+    out = []
+    valid = []
+    for s in values:
+        if _is_missing(s):
+            out.append(None)
+            valid.append(True)
+            continue
+        try:
+            out.append(parse(s))
+            valid.append(True)
+        except Exception:
+            out.append(None)
+            valid.append(False)
+    return out, valid
+
+
+def _parse_column_as(values, parse, dtype, kinds):
+    """
+    int()/float() and a set lookup already run at C speed per element, and
+    measured faster than pandas' string-to-number paths, so text columns
+    always use the loop; arrays just get the same pandas/numpy result types.
+
+    Arrays whose dtype kind is in `kinds` (numpy kind codes, e.g. "iu" for
+    integers) already hold the right kind of value and are cast as a whole.
+    """
+    if _is_array(values):
+        if values.dtype.kind in kinds:
+            try:
+                parsed = pd.Series(values).astype(dtype).reset_index(drop=True)
+                return parsed, np.ones(len(parsed), dtype=bool)
+            except (TypeError, ValueError):
+                pass  # e.g. 1.5 in a float column parsed as ints: check each element
+        out, valid = _parse_column(values, parse)
+        return pd.Series(out, dtype=dtype), np.array(valid, dtype=bool)
+    return _parse_column(values, parse)
+
+
+# Element parsers for the columns: values that are already numbers or
+# booleans (Python or numpy) are taken as they are, text goes through
+# parse_int / parse_float / parse_bool.
+
+def _not_bool(v, what):
+    if isinstance(v, (bool, np.bool_) if np is not None else bool):
+        raise ValueError(f"Could not convert the boolean to {what}.")
+
+
+def _column_int(v):
+    _not_bool(v, "an integer")
+    if isinstance(v, Integral):
+        return int(v)
+    if isinstance(v, Real):
+        if float(v).is_integer():
+            return int(v)
+        raise ValueError("Could not convert the value to an integer.")
+    return parse_int(v)
+
+
+def _column_float(v):
+    _not_bool(v, "a float")
+    if isinstance(v, Real):
+        return float(v)
+    return parse_float(v)
+
+
+def _column_bool(v):
+    if isinstance(v, (bool, np.bool_) if np is not None else bool):
+        return bool(v)
+    if isinstance(v, Integral) and v in (0, 1):
+        return bool(v)
+    if isinstance(v, Real):
+        raise ValueError("Could not convert the value to a boolean.")
+    return parse_bool(v)
+
+
+def _to_string_series(values):
+    """Returns (stripped strings, mask of empty entries) as pandas objects."""
+    strings = pd.Series(values, dtype="string").str.strip().reset_index(drop=True)
+    empty = strings.isna() | (strings == "")
+    return strings, empty.to_numpy(dtype=bool)
+
+
+def _result(parsed, empty):
+    """(values, valid) for the pandas path: missing and parsed are valid."""
+    return parsed, empty | parsed.notna().to_numpy(dtype=bool)
+
+
+def parse_dates(values, sniff: bool = True):
+    """
+    Parses a column of dates (YYYY-MM-DD or MM/DD/YYYY).
+    sniff=True tries the format of the column's first values first.
+    Returns (values, valid); see COLUMN (BULK) PARSING above.
+    """
+    if _is_array(values):
+        if len(values) >= VECTORIZE_MIN_ROWS:
+            return _parse_dates_vectorized(values, sniff)
+        out, valid = _parse_dates_list(list(values), sniff)
+        # to_datetime picks the same datetime64 unit as the vectorized path
+        return pd.Series(pd.to_datetime(out)), np.array(valid, dtype=bool)
+
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    return _parse_dates_list(values, sniff)
+
+
+def _parse_dates_list(values, sniff):
+    """
+    Per-element path. Columns repeat the same dates, so every element goes
+    through an lru_cache'd parser that returns None instead of raising;
+    map() then runs the loop in C, which beats calling parse_date() on each.
+    """
+    formats = sniff_date_formats(values) if sniff else DATE_FORMATS
+    if formats == DATE_FORMATS:
+        parse = _column_date_cached
+    else:
+        parse = lru_cache(maxsize=DATE_CACHE_SIZE)(partial(_column_date, formats=formats))
+
+    out = list(map(parse, values))
+    # None, blank text and NaN are just missing
+    valid = [v is not None or _is_missing(s) for s, v in zip(values, out)]
+    return out, valid
+
+
+def _parse_dates_vectorized(values, sniff):
+    """pandas path for numpy arrays / Series: one to_datetime pass per format."""
+    strings, empty = _to_string_series(values)
+    formats = sniff_date_formats(strings.iloc[:100].tolist()) if sniff else DATE_FORMATS
+
+    parsed = pd.to_datetime(strings, format=formats[0], errors="coerce")
+    for fmt in formats[1:]:
+        # Only the rows the earlier formats missed get another pass
+        retry = parsed.isna().to_numpy(dtype=bool) & ~empty
+        if retry.any():
+            parsed[retry] = pd.to_datetime(strings[retry], format=fmt, errors="coerce")
+    return _result(parsed, empty)
+
+
+def parse_ints(values):
+    """
+    Parses a column of integers.
+    Returns (values, valid); see COLUMN (BULK) PARSING above.
+    """
+    return _parse_column_as(values, _column_int, "Int64", "iu")
+
+
+def parse_floats(values):
+    """
+    Parses a column of floats.
+    Returns (values, valid); see COLUMN (BULK) PARSING above.
+    """
+    return _parse_column_as(values, _column_float, "Float64", "iuf")
+
+
+def parse_bools(values):
+    """
+    Parses a column of booleans (true/false, yes/no, y/n, 1/0, on/off).
+    Returns (values, valid); see COLUMN (BULK) PARSING above.
+    """
+    return _parse_column_as(values, _column_bool, "boolean", "b")
@@ -1,10 +1,15 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 
 # Local module imports
+import db_pool
+import emp_db_async
+import tk_async
 import ui_util
+import user_type_db
 import employee_search_form
 import employee_edit_form
+import reports_form
 
 # ---------- Top-Level Form Handlers ----------
 
@@ -18,7 +23,7 @@ def open_add():
 
 
 def open_reports():
-    messagebox.showinfo("Reports", "This will open the Reports screen.")  # Placeholder
+    reports_form.open_reports_form(root)  # Launch reports window
 
 
 def create_nav_button(parent, text, command):
@@ -33,6 +38,12 @@ def main():
     root = tk.Tk()
     root.title("Employee Management System")
 
+    # Preload the user type lookup used by the search and edit forms
+    user_type_db.get_user_types()
+
+    # Background asyncio loop for DB calls, results delivered via root.after
+    tk_async.start(root)
+
     # Center the window on screen
     w, h = 640, 480
     x, y = ui_util.compute_win_pos(w, h, root)
@@ -53,6 +64,11 @@ def main():
     # --- Start the GUI event loop ---
     root.mainloop()
 
+    # --- Stop background work and release pooled DB connections on exit ---
+    tk_async.stop()
+    emp_db_async.shutdown()
+    db_pool.close_all()
+
 
 # ---------- Run App ----------
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import sqlite3
+import threading
+
+DB_FILE = "employee.db"
+
+# Pragmas applied once to every new connection.
+# - WAL lets readers and the writer work at the same time.
+# - synchronous=NORMAL is safe with WAL and avoids an fsync per commit.
+# - mmap_size lets SQLite read pages straight from memory-mapped file.
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",  # 256 MB
+    "PRAGMA cache_size = -16000",  # ~16 MB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Each thread keeps its own connections (sqlite3 connections must not be
+# shared between threads), keyed by database file.
+_local = threading.local()
+
+# Every connection ever opened, so close_all() can clean them up.
+_all_connections = []
+_all_lock = threading.Lock()
+
+# Bumped by close_all() so threads know their cached connections are gone.
+_generation = 0
+
+
+# ---------- Connection Setup ----------
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    A plain sqlite3 connection that also supports weak references, so other
+    modules can keep per-connection state in a WeakKeyDictionary.
+    """
+
+
+def _open(db_file: str) -> sqlite3.Connection:
+    """Open a new connection and apply the tuned pragmas."""
+    # The connection is only used by the thread that opened it, but
+    # check_same_thread=False lets close_all() and interrupt() reach it.
+    conn = sqlite3.connect(db_file, check_same_thread=False, factory=PooledConnection)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# ---------- Public API ----------
+
+
+def get_connection(db_file: str = DB_FILE) -> sqlite3.Connection:
+    """
+    Returns the long-lived connection for the current thread.
+    The connection is created on first use and reused afterwards.
+    """
+    conns = getattr(_local, "conns", None)
+    if conns is None or _local.generation != _generation:
+        conns = _local.conns = {}
+        _local.generation = _generation
+
+    conn = conns.get(db_file)
+    if conn is None:
+        conn = _open(db_file)
+        conns[db_file] = conn
+        with _all_lock:
+            _all_connections.append(conn)
+    return conn
+
+
+def close_connection(db_file: str = DB_FILE):
+    """Closes the current thread's connection (if any) to db_file."""
+    conns = getattr(_local, "conns", None)
+    if not conns or db_file not in conns:
+        return
+
+    conn = conns.pop(db_file)
+    with _all_lock:
+        if conn in _all_connections:
+            _all_connections.remove(conn)
+    conn.close()
+
+
+def close_all():
+    """
+    Closes every pooled connection from every thread.
+    Call this once when the application exits.
+    """
+    global _generation
+
+    with _all_lock:
+        conns = list(_all_connections)
+        _all_connections.clear()
+        _generation += 1
+
+    for conn in conns:
+        conn.close()
@@ -0,0 +1,224 @@
+"""
+Import and export the employee table as CSV.
+
+Both directions stream: export fetches rows from SQLite in batches and
+import reads the file with csv.DictReader in chunks of --chunk-rows rows,
+so memory stays bounded even for multi-GB files. Rows are checked with
+the same record schema as the add/edit form (emp_record), and each import
+chunk is written with emp_db's batched bulk API and committed on its own.
+
+Files use UTF-8 with a BOM (utf-8-sig), like the python_csv examples, so
+they open cleanly in Excel. Columns: emp_id, name, dob, user_type. On
+import emp_id is optional: rows with an emp_id update that employee (or
+create it with that id), rows without one are inserted.
+
+Usage:
+    python python_crud/emp_csv.py export employees.csv
+    python python_crud/emp_csv.py import employees.csv --db employee.db
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from itertools import islice
+
+# Add project root to the Python path for importing custom modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import db_pool
+import emp_db
+import emp_record
+import user_type_db
+
+FIELDNAMES = ["emp_id", "name", "dob", "user_type"]
+
+# Rows read from the file and committed together during an import
+CHUNK_ROWS = 50_000
+
+# Print progress every this many exported rows
+EXPORT_PROGRESS_ROWS = 100_000
+
+# Only the first errors are printed; the summary has the full count
+MAX_ERRORS_SHOWN = 20
+
+
+# ---------- Export ----------
+
+
+def export_csv(path: str, batch_size: int = emp_db.BULK_BATCH_SIZE) -> dict:
+    """
+    Write every employee to a CSV file.
+    Returns {"rows", "seconds", "rows_per_sec"}.
+    """
+    start = time.perf_counter()
+    written = 0
+
+    with open(path, mode="w", encoding="utf-8-sig", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+        writer.writeheader()
+
+        rows = emp_db.iter_employees(batch_size)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            writer.writerows(dict(zip(FIELDNAMES, row)) for row in batch)
+
+            previous = written
+            written += len(batch)
+            if written // EXPORT_PROGRESS_ROWS != previous // EXPORT_PROGRESS_ROWS:
+                _print_progress("Exported", written, start)
+
+    seconds = time.perf_counter() - start
+    return {
+        "rows": written,
+        "seconds": seconds,
+        "rows_per_sec": written / seconds if seconds > 0 else 0.0,
+    }
+
+
+# ---------- Import ----------
+
+
+def parse_records(records: list[dict]):
+    """
+    Convert a chunk of CSV records with the compiled employee schema.
+    Returns (rows, errors): rows is a list of
+    (chunk_index, (emp_id, name, dob, user_type)), errors a list of
+    (chunk_index, error_message) naming every bad field of the record.
+    """
+    parse = emp_record.parse_csv_employee
+    rows = []
+    errors = []
+    for i, record in enumerate(records):
+        values, bad = parse(record)
+        if bad:
+            errors.append(
+                (i, " ".join(f"{message} ({field}={record.get(field)!r})" for field, message in bad))
+            )
+        else:
+            rows.append((i, values))
+    return rows, errors
+
+
+def import_csv(
+    path: str,
+    chunk_rows: int = CHUNK_ROWS,
+    batch_size: int = emp_db.BULK_BATCH_SIZE,
+) -> dict:
+    """
+    Load employees from a CSV file, committing every chunk_rows rows.
+
+    Returns {"rows", "errors", "seconds", "rows_per_sec"} where errors is a
+    list of (row_number, error_message); row_number counts data rows from 1.
+    """
+    start = time.perf_counter()
+    written = 0
+    errors = []
+    row_number = 0
+
+    with open(path, mode="r", encoding="utf-8-sig", newline="") as file:
+        reader = csv.DictReader(file)
+        missing = {"name", "dob", "user_type"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"Missing CSV column(s): {', '.join(sorted(missing))}")
+
+        while True:
+            records = list(islice(reader, chunk_rows))
+            if not records:
+                break
+
+            # Parse first so bad rows are reported with their row number
+            parsed, bad = parse_records(records)
+            errors += [(row_number + i + 1, message) for i, message in bad]
+            inserts, upserts = [], []
+            for i, (emp_id, name, dob, user_type) in parsed:
+                if emp_id is None:
+                    inserts.append((row_number + i + 1, (name, dob, user_type)))
+                else:
+                    upserts.append((row_number + i + 1, (emp_id, name, dob, user_type)))
+            row_number += len(records)
+
+            for rows, write in (
+                (inserts, emp_db.insert_employees),
+                (upserts, emp_db.upsert_employees),
+            ):
+                if not rows:
+                    continue
+                summary = write((row for _, row in rows), batch_size)
+                written += summary["rows"]
+                # Map indexes within this batch back to CSV row numbers
+                errors += [(rows[index][0], message) for index, message in summary["errors"]]
+
+            _print_progress("Imported", written, start)
+
+    errors.sort()
+    seconds = time.perf_counter() - start
+    return {
+        "rows": written,
+        "errors": errors,
+        "seconds": seconds,
+        "rows_per_sec": written / seconds if seconds > 0 else 0.0,
+    }
+
+
+# ---------- Main ----------
+
+
+def _print_progress(action, rows, start):
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"  {action} {rows:,} rows ({rate:,.0f} rows/sec)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import or export employees as CSV.")
+    parser.add_argument("command", choices=("import", "export"))
+    parser.add_argument("file", help="CSV file to read or write")
+    parser.add_argument("--db", default=emp_db.DB_FILE, help="employee database file")
+    parser.add_argument(
+        "--chunk-rows", type=int, default=CHUNK_ROWS, help="rows committed together on import"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=emp_db.BULK_BATCH_SIZE,
+        help="rows per executemany()/fetchmany() call",
+    )
+    args = parser.parse_args()
+
+    emp_db.DB_FILE = args.db
+    user_type_db.DB_FILE = args.db
+
+    try:
+        if args.command == "export":
+            summary = export_csv(args.file, args.batch_size)
+            print(
+                f"Exported {summary['rows']:,} rows to {args.file} in "
+                f"{summary['seconds']:.1f}s ({summary['rows_per_sec']:,.0f} rows/sec)"
+            )
+            return
+
+        summary = import_csv(args.file, args.chunk_rows, args.batch_size)
+        print(
+            f"Imported {summary['rows']:,} rows from {args.file} in "
+            f"{summary['seconds']:.1f}s ({summary['rows_per_sec']:,.0f} rows/sec)"
+        )
+        errors = summary["errors"]
+        if errors:
+            print(f"{len(errors):,} row(s) skipped:")
+            for row_number, message in errors[:MAX_ERRORS_SHOWN]:
+                print(f"  row {row_number}: {message}")
+            if len(errors) > MAX_ERRORS_SHOWN:
+                print(f"  ... and {len(errors) - MAX_ERRORS_SHOWN:,} more")
+            sys.exit(1)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        db_pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
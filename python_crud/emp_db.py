@@ -1,84 +1,559 @@
-import sqlite3
+import os
+import sys
+import threading
+import time
+import weakref
 from datetime import date
+from itertools import islice
 
-DB_FILE = "employee.db"
+# Add project root to the Python path for importing custom modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Local imports
+import db_pool
+import emp_schema
+import parse_util
+import query_cache
 
-def search_employees(
-    name: str | None = None, dob: date | None = None, user_type: int | None = None
-):
-    """Search employees based on filters."""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+DB_FILE = db_pool.DB_FILE
+
+# Default number of rows sent to executemany() at a time by the bulk APIs
+BULK_BATCH_SIZE = 1000
+
+# Default number of rows returned per page by search_employees_page()
+PAGE_SIZE = 200
+
+
+# db_file -> True if the employee_fts table is available
+_fts_enabled = {}
+_schema_lock = threading.Lock()
+
+# Search results cache, invalidated whenever the employee table changes
+_search_cache = query_cache.QueryCache()
+
+# Pooled connection -> last PRAGMA data_version seen on it. Weak keys, so a
+# closed connection's entry goes away with it instead of being inherited by
+# a new connection that happens to reuse its id().
+_data_versions = weakref.WeakKeyDictionary()
+
+
+def _date_to_str(dob):
+    """
+    Convert a date, or date text in any format parse_util.parse_date reads,
+    to the YYYY-MM-DD text stored in the dob column; None and "" give None.
+    Raises ValueError for text that is not a date, so bulk loads report
+    the row instead of storing text the dob search and stats can't read.
+    """
+    if isinstance(dob, str):
+        dob = parse_util.parse_date(dob)
+    return dob.strftime("%Y-%m-%d") if isinstance(dob, date) else dob
+
+
+def get_connection():
+    """
+    Returns this thread's pooled connection to DB_FILE, migrating the schema
+    once per file. report_db reads the summary tables through it as well.
+    """
+    conn = db_pool.get_connection(DB_FILE)
+    if DB_FILE not in _fts_enabled:
+        with _schema_lock:
+            if DB_FILE not in _fts_enabled:
+                emp_schema.migrate(conn)
+                _fts_enabled[DB_FILE] = emp_schema.has_fts(conn)
+    return conn
+
+
+# ---------- Search Cache ----------
+
+
+def _cache_key(kind, name, dob, user_type, *extra):
+    """
+    Key a search on the filter values exactly as they are bound into the
+    SQL: spaces change the FTS phrase and LIKE pattern, and LIKE only folds
+    ASCII case, so "normalizing" the name could mix up different searches.
+    """
+    dob = _date_to_str(dob)
+    return (kind, DB_FILE, name, dob, user_type) + extra
+
+
+def _check_external_writes(conn):
+    """
+    PRAGMA data_version changes when ANOTHER connection (another thread or
+    process) commits to the database. If it moved, drop cached results.
+
+    A connection's first query has no earlier version to compare with, and
+    another process may have written since the cached results were stored,
+    so the cache is dropped then too (once per pooled connection).
+    """
+    version = conn.execute("PRAGMA data_version").fetchone()[0]
+    last = _data_versions.get(conn)
+    _data_versions[conn] = version
+    if last != version:
+        _search_cache.invalidate()
+
+
+def _cached_query(conn, key, query, params):
+    """Run a search query through the cache. Error results are not cached."""
+    _check_external_writes(conn)
+
+    found, rows = _search_cache.get(key)
+    if found:
+        return list(rows)
+
+    generation = _search_cache.generation
+    rows = conn.execute(query, params).fetchall()
+    _search_cache.put(key, tuple(rows), generation)
+    return rows
+
+
+def invalidate_search_cache():
+    """Drop all cached search results (e.g. after writing with raw SQL)."""
+    _search_cache.invalidate()
+
+
+def configure_search_cache(max_size: int | None = None, ttl_seconds: float | None = None):
+    """Change the search cache limits; max_size=0 turns caching off."""
+    if max_size is not None:
+        _search_cache.max_size = max_size
+    if ttl_seconds is not None:
+        _search_cache.ttl_seconds = ttl_seconds
+    _search_cache.invalidate()
 
-    query = "SELECT emp_id, name, dob, user_type FROM employee WHERE 1=1"
+
+def search_cache_stats() -> dict:
+    """Returns the search cache hit/miss counters for monitoring."""
+    return _search_cache.stats()
+
+
+def _escape_like(s: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Sortable result columns -> SQL sort expression. The expressions match the
+# indexes in emp_schema so sorted pages are read straight from an index.
+SORT_COLUMNS = {
+    "emp_id": None,  # The key column itself
+    "name": "e.name COLLATE NOCASE",
+    "dob": "IFNULL(e.dob, '')",
+    "user_type": "e.user_type",
+}
+
+
+# Names shorter than FTS_MIN_CHARS can't use the trigram index. They still
+# match anywhere in the name, like every other name search, which means a
+# scan of the name column; check_query_plans.py lists it as accepted.
+_SHORT_NAME_MATCH = "e.name LIKE '%' || ? || '%' ESCAPE '\\'"
+
+
+def _name_match(name):
+    """
+    Returns (sql, params) matching `name` in e.name the same way the name
+    filter does: anywhere in the name (see _SHORT_NAME_MATCH for text too
+    short for the trigram index).
+    """
+    if not _fts_enabled.get(DB_FILE):
+        return "e.name LIKE ?", [f"%{name}%"]
+    if len(name) >= emp_schema.FTS_MIN_CHARS:
+        return (
+            "e.emp_id IN (SELECT rowid FROM employee_fts WHERE employee_fts MATCH ?)",
+            ['"' + name.replace('"', '""') + '"'],
+        )
+    return _SHORT_NAME_MATCH, [_escape_like(name)]
+
+
+def _build_search_query(name, dob, user_type, quick_filter=None):
+    """
+    Build the search SQL and parameters for the given filters.
+    Returns (query, params, key_col) where key_col is the emp_id column to
+    use for ORDER BY / keyset paging.
+    """
+    select = "SELECT e.emp_id, e.name, e.dob, e.user_type"
+    query = f"{select} FROM employee e WHERE 1=1"
+    key_col = "e.emp_id"
     params = []
 
     if name is not None:
-        query += " AND name LIKE ?"
-        params.append(f"%{name}%")
+        if not _fts_enabled.get(DB_FILE):
+            # No full-text index: plain substring scan
+            query += " AND e.name LIKE ?"
+            params.append(f"%{name}%")
+        elif dob is not None:
+            # An exact dob narrows the search to a handful of rows via its
+            # index; checking those names directly beats probing the FTS
+            # index once per row
+            query += " AND e.name LIKE ? ESCAPE '\\'"
+            params.append(f"%{_escape_like(name)}%")
+        elif len(name) >= emp_schema.FTS_MIN_CHARS:
+            # Substring match through the trigram index. Driving the join
+            # from the FTS table streams matches in rowid order, so a LIMIT
+            # stops early instead of collecting every match first.
+            query = (
+                f"{select} FROM employee_fts f"
+                " JOIN employee e ON e.emp_id = f.rowid"
+                " WHERE f.employee_fts MATCH ?"
+            )
+            key_col = "f.rowid"
+            params.append('"' + name.replace('"', '""') + '"')
+        else:
+            # Too short for trigrams: substring scan (see _SHORT_NAME_MATCH)
+            query += f" AND {_SHORT_NAME_MATCH}"
+            params.append(_escape_like(name))
 
     if dob is not None:
-        query += " AND dob = ?"
+        query += " AND e.dob = ?"
         params.append(dob.strftime("%Y-%m-%d"))
 
     if user_type is not None:
-        query += " AND user_type = ?"
+        query += " AND e.user_type = ?"
         params.append(user_type)
 
+    quick_filter = quick_filter.strip() if quick_filter else None
+    if quick_filter:
+        # Quick filter: text in the name, in the user type name, or an exact
+        # emp_id. Matching types are looked up first (a tiny table) so when
+        # none match, the name match alone can use the indexes.
+        name_sql, name_params = _name_match(quick_filter)
+        clauses = [name_sql]
+        params += name_params
+
+        types = [
+            row[0]
+            for row in get_connection().execute(
+                "SELECT user_type FROM user_types WHERE name LIKE ? ESCAPE '\\'",
+                (f"%{_escape_like(quick_filter)}%",),
+            )
+        ]
+        if types:
+            # Unary + keeps this off the user_type index: a type like
+            # Engineer matches most rows, so walking the sort order and
+            # stopping at LIMIT beats collecting every match to sort them
+            clauses.append(f"+e.user_type IN ({', '.join('?' * len(types))})")
+            params += types
+
+        if quick_filter.isdigit():
+            clauses.append("e.emp_id = ?")
+            params.append(int(quick_filter))
+
+        query += f" AND ({' OR '.join(clauses)})"
+
+    return query, params, key_col
+
+
+def _order_clause(key_col, order_by, descending, after_id, after_value):
+    """
+    Returns (where_sql, params, order_sql) for keyset paging in the given
+    sort order. Rows are ordered by (sort column, emp_id) so ties keep a
+    stable order; after_value/after_id come from page_key() of the last row.
+    """
+    if order_by not in SORT_COLUMNS:
+        raise ValueError(f"Cannot sort by {order_by!r}")
+    sort_expr = SORT_COLUMNS[order_by]
+    direction = " DESC" if descending else ""
+    op = "<" if descending else ">"
+
+    where, params = "", []
+    if sort_expr is None:
+        if after_id is not None:
+            where = f" AND {key_col} {op} ?"
+            params = [after_id]
+        return where, params, f" ORDER BY {key_col}{direction}"
+
+    if after_id is not None:
+        # Written out instead of a row value (a, b) > (?, ?) so SQLite
+        # can start the index range at the first sort value
+        where = f" AND {sort_expr} {op}= ? AND ({sort_expr} {op} ? OR {key_col} {op} ?)"
+        params = [after_value, after_value, after_id]
+    return where, params, f" ORDER BY {sort_expr}{direction}, {key_col}{direction}"
+
+
+def page_key(row, order_by: str = "emp_id"):
+    """Returns (after_value, after_id) to request the page after `row`."""
+    emp_id, name, dob, user_type = row
+    after_value = {"emp_id": None, "name": name, "dob": dob or "", "user_type": user_type}
+    return after_value[order_by], emp_id
+
+
+def _normalize_filter(text):
+    """The quick filter as _build_search_query binds it (stripped)."""
+    return text.strip() or None if text else None
+
+
+def search_employees(
+    name: str | None = None,
+    dob: date | None = None,
+    user_type: int | None = None,
+    order_by: str = "emp_id",
+    descending: bool = False,
+    quick_filter: str | None = None,
+):
+    """
+    Search employees based on filters.
+    Names match anywhere in the name: through the full-text index for 3+
+    characters, by scanning names for shorter text.
+    """
     try:
-        results = cursor.execute(query, params).fetchall()
-        return results
+        conn = get_connection()
+        query, params, key_col = _build_search_query(name, dob, user_type, quick_filter)
+        _, _, order_sql = _order_clause(key_col, order_by, descending, None, None)
+        query += order_sql
+        key = _cache_key(
+            "all", name, dob, user_type, _normalize_filter(quick_filter), order_by, descending
+        )
+        return _cached_query(conn, key, query, params)
     except Exception as e:
         return [("Error", str(e))]
+
+
+def get_employee(emp_id: int):
+    """Returns one employee row (emp_id, name, dob, user_type) or None."""
+    try:
+        conn = get_connection()
+        return conn.execute(
+            "SELECT emp_id, name, dob, user_type FROM employee WHERE emp_id = ?",
+            (emp_id,),
+        ).fetchone()
+    except Exception as e:
+        return ("Error", str(e))
+
+
+def search_employees_page(
+    name: str | None = None,
+    dob: date | None = None,
+    user_type: int | None = None,
+    after_id: int | None = None,
+    limit: int = PAGE_SIZE,
+    order_by: str = "emp_id",
+    descending: bool = False,
+    after_value=None,
+    quick_filter: str | None = None,
+):
+    """
+    Returns one page of search results sorted by order_by (a SORT_COLUMNS
+    key), then emp_id.
+
+    Keyset paging: pass page_key(last_row, order_by) of the previous page
+    as after_value, after_id to get the next page. Unlike OFFSET, each page
+    costs the same no matter how deep the user has scrolled.
+    """
+    try:
+        conn = get_connection()
+        query, params, key_col = _build_search_query(name, dob, user_type, quick_filter)
+
+        where, order_params, order_sql = _order_clause(
+            key_col, order_by, descending, after_id, after_value
+        )
+        query += where + order_sql + " LIMIT ?"
+        params += order_params + [limit]
+
+        key = _cache_key(
+            "page", name, dob, user_type, _normalize_filter(quick_filter),
+            order_by, descending, after_value, after_id, limit,
+        )
+        return _cached_query(conn, key, query, params)
+    except Exception as e:
+        return [("Error", str(e))]
+
+
+def iter_employees(batch_size: int = BULK_BATCH_SIZE):
+    """
+    Yields every employee row (emp_id, name, dob, user_type) in emp_id
+    order, fetching batch_size rows at a time so memory stays bounded.
+    """
+    conn = get_connection()
+    cursor = conn.execute(
+        "SELECT emp_id, name, dob, user_type FROM employee ORDER BY emp_id"
+    )
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
     finally:
         cursor.close()
-        conn.close()
+
+
+def explain_search(
+    name: str | None = None,
+    dob: date | None = None,
+    user_type: int | None = None,
+    order_by: str | None = None,
+    quick_filter: str | None = None,
+) -> list[str]:
+    """
+    Returns the EXPLAIN QUERY PLAN detail lines for a search, or for a
+    sorted page (not the first) when order_by is given.
+    """
+    conn = get_connection()
+    query, params, key_col = _build_search_query(name, dob, user_type, quick_filter)
+    if order_by is not None:
+        where, order_params, order_sql = _order_clause(key_col, order_by, False, 0, "")
+        query += where + order_sql + " LIMIT ?"
+        params += order_params + [PAGE_SIZE]
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params)]
 
 
 def insert_employee(name: str, dob: date | None, user_type: int):
     """Insert a new employee record."""
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
+        conn = get_connection()
 
         # SQLite does not support Date type directly, so we store it as text
         # Convert date to YYYY-MM-DD format
         date_str = dob.strftime("%Y-%m-%d") if isinstance(dob, date) else None
 
-        cursor.execute(
-            "INSERT INTO employee (name, dob, user_type) VALUES (?, ?, ?)",
-            (name, date_str, user_type),
-        )
-        conn.commit()
+        # 'with conn' commits on success and rolls back on error
+        with conn:
+            conn.execute(
+                "INSERT INTO employee (name, dob, user_type) VALUES (?, ?, ?)",
+                (name, date_str, user_type),
+            )
+        _search_cache.invalidate()
         return None
     except Exception as e:
         return str(e)
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def update_employee(emp_id: int, name: str, dob: date | None, user_type: int):
     """Update an existing employee record."""
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
+        conn = get_connection()
 
         date_str = dob.strftime("%Y-%m-%d") if isinstance(dob, date) else None
-        
-        cursor.execute(
-            """
-            UPDATE employee
-            SET name = ?, dob = ?, user_type = ?
-            WHERE emp_id = ?
-            """,
-            (name, date_str, user_type, emp_id),
-        )
-        conn.commit()
+
+        with conn:
+            conn.execute(
+                """
+                UPDATE employee
+                SET name = ?, dob = ?, user_type = ?
+                WHERE emp_id = ?
+                """,
+                (name, date_str, user_type, emp_id),
+            )
+        _search_cache.invalidate()
         return None
     except Exception as e:
         return str(e)
+
+
+# ---------- Bulk Insert / Upsert ----------
+
+
+def _bulk_write(sql: str, rows, convert, batch_size: int) -> dict:
+    """
+    Stream rows through executemany() in batches inside ONE transaction.
+
+    convert(row) turns each input row into SQL parameters. Each batch runs
+    under a SAVEPOINT; if any row in it fails, the batch is rolled back and
+    replayed row by row so good rows are kept and bad rows are reported as
+    (row_index, error_message).
+    """
+    conn = get_connection()
+    rows = iter(rows)
+    written = 0
+    errors = []
+    index = 0
+    start = time.perf_counter()
+
+    conn.execute("BEGIN")
+    try:
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                break
+
+            # Convert rows up front so one malformed row can't stop the load
+            batch = []
+            for i, row in enumerate(chunk):
+                try:
+                    batch.append((index + i, convert(row)))
+                except Exception as e:
+                    errors.append((index + i, str(e)))
+            index += len(chunk)
+
+            conn.execute("SAVEPOINT bulk_batch")
+            try:
+                conn.executemany(sql, [params for _, params in batch])
+                written += len(batch)
+            except Exception:
+                # Undo the partial batch, then retry one row at a time
+                conn.execute("ROLLBACK TO bulk_batch")
+                for row_index, params in batch:
+                    try:
+                        conn.execute(sql, params)
+                        written += 1
+                    except Exception as e:
+                        errors.append((row_index, str(e)))
+            conn.execute("RELEASE bulk_batch")
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
     finally:
-        cursor.close()
-        conn.close()
+        _search_cache.invalidate()
+
+    errors.sort()
+    seconds = time.perf_counter() - start
+    return {
+        "rows": written,
+        "errors": errors,
+        "seconds": seconds,
+        "rows_per_sec": written / seconds if seconds > 0 else 0.0,
+    }
+
+
+def _employee_params(row):
+    name, dob, user_type = row
+    return (name, _date_to_str(dob), user_type)
+
+
+def _employee_params_with_id(row):
+    emp_id, name, dob, user_type = row
+    return (emp_id, name, _date_to_str(dob), user_type)
+
+
+def insert_employees(rows, batch_size: int = BULK_BATCH_SIZE) -> dict:
+    """
+    Insert many employees in a single transaction.
+
+    rows: iterable of (name, dob, user_type); dob may be a date, None, or
+    text in a format parse_util.parse_date reads (stored as YYYY-MM-DD).
+    Returns {"rows", "errors", "seconds", "rows_per_sec"} where errors is a
+    list of (row_index, error_message) for rows that were skipped.
+    """
+    return _bulk_write(
+        "INSERT INTO employee (name, dob, user_type) VALUES (?, ?, ?)",
+        rows,
+        _employee_params,
+        batch_size,
+    )
+
+
+def upsert_employees(rows, batch_size: int = BULK_BATCH_SIZE) -> dict:
+    """
+    Insert or update many employees in a single transaction.
+
+    rows: iterable of (emp_id, name, dob, user_type). Rows whose emp_id
+    already exists are updated; emp_id None inserts a new employee.
+    Existing rows that already hold the same values are left untouched, so
+    re-importing a mostly unchanged file doesn't fire the FTS and stats
+    triggers for every row.
+    Returns the same summary dict as insert_employees().
+    """
+    return _bulk_write(
+        """
+        INSERT INTO employee (emp_id, name, dob, user_type) VALUES (?, ?, ?, ?)
+        ON CONFLICT(emp_id) DO UPDATE SET
+            name = excluded.name,
+            dob = excluded.dob,
+            user_type = excluded.user_type
+        WHERE name IS NOT excluded.name
+            OR dob IS NOT excluded.dob
+            OR user_type IS NOT excluded.user_type
+        """,
+        rows,
+        _employee_params_with_id,
+        batch_size,
+    )
@@ -0,0 +1,110 @@
+"""
+Asyncio versions of the emp_db functions.
+
+The blocking sqlite3 calls run on a small, fixed set of DB threads:
+- reads share a pool of READ_WORKERS threads (WAL lets them run together),
+- writes go through ONE writer thread, since SQLite allows a single writer.
+
+Any number of coroutines can await these functions at the same time;
+they queue on the executors instead of each needing its own thread.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
+
+import emp_db
+import report_db
+
+READ_WORKERS = 4
+
+_read_executor = ThreadPoolExecutor(READ_WORKERS, thread_name_prefix="emp-db-read")
+_write_executor = ThreadPoolExecutor(1, thread_name_prefix="emp-db-write")
+
+
+async def _run(executor, fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
+
+# ---------- Reads ----------
+
+
+async def search_employees(
+    name: str | None = None,
+    dob: date | None = None,
+    user_type: int | None = None,
+    order_by: str = "emp_id",
+    descending: bool = False,
+    quick_filter: str | None = None,
+):
+    """Async version of emp_db.search_employees()."""
+    return await _run(
+        _read_executor,
+        emp_db.search_employees,
+        name,
+        dob,
+        user_type,
+        order_by,
+        descending,
+        quick_filter,
+    )
+
+
+async def get_employee(emp_id: int):
+    """Async version of emp_db.get_employee()."""
+    return await _run(_read_executor, emp_db.get_employee, emp_id)
+
+
+async def search_employees_page(
+    name: str | None = None,
+    dob: date | None = None,
+    user_type: int | None = None,
+    after_id: int | None = None,
+    limit: int = emp_db.PAGE_SIZE,
+    order_by: str = "emp_id",
+    descending: bool = False,
+    after_value=None,
+    quick_filter: str | None = None,
+):
+    """Async version of emp_db.search_employees_page()."""
+    return await _run(
+        _read_executor,
+        emp_db.search_employees_page,
+        name,
+        dob,
+        user_type,
+        after_id,
+        limit,
+        order_by,
+        descending,
+        after_value,
+        quick_filter,
+    )
+
+
+# ---------- Writes ----------
+
+
+async def insert_employee(name: str, dob: date | None, user_type: int):
+    """Async version of emp_db.insert_employee(). Returns an error string or None."""
+    return await _run(_write_executor, emp_db.insert_employee, name, dob, user_type)
+
+
+async def update_employee(emp_id: int, name: str, dob: date | None, user_type: int):
+    """Async version of emp_db.update_employee(). Returns an error string or None."""
+    return await _run(
+        _write_executor, emp_db.update_employee, emp_id, name, dob, user_type
+    )
+
+
+async def rebuild_stats():
+    """Async version of report_db.rebuild_stats(). Returns an error string or None."""
+    return await _run(_write_executor, report_db.rebuild_stats)
+
+
+def shutdown():
+    """Stop the DB threads once pending work has finished."""
+    _read_executor.shutdown(wait=True)
+    _write_executor.shutdown(wait=True)
@@ -0,0 +1,39 @@
+import os
+import sys
+
+# Add project root to the Python path for importing custom modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import user_type_db
+from record_schema import Field, RecordSchema
+
+# ---------- Employee Record Schemas ----------
+#
+# Shared by the add/edit form and the CSV import so both accept and reject
+# exactly the same input, with the same messages.
+
+EMPLOYEE_FIELDS = [
+    Field("name", "str", required=True, label="Name"),
+    Field("dob", "date", label="Date of Birth"),
+    Field(
+        "user_type",
+        "int",
+        required=True,
+        label="User Type",
+        validator=user_type_db.is_valid_user_type,
+        message="User Type is unknown.",
+    ),
+]
+
+EMPLOYEE_SCHEMA = RecordSchema(EMPLOYEE_FIELDS)
+
+# CSV rows may also carry the emp_id of an existing employee
+CSV_EMPLOYEE_SCHEMA = RecordSchema([Field("emp_id", "int", label="emp_id")] + EMPLOYEE_FIELDS)
+
+# parse_employee({"name": ..., "dob": ..., "user_type": ...})
+#   -> ((name, dob, user_type), [(field, message), ...])
+parse_employee = EMPLOYEE_SCHEMA.compile()
+
+# parse_csv_employee(csv_row) -> ((emp_id, name, dob, user_type), errors)
+parse_csv_employee = CSV_EMPLOYEE_SCHEMA.compile()
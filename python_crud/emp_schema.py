@@ -0,0 +1,185 @@
+import sqlite3
+
+# ---------- Report Statistics ----------
+#
+# Summary tables behind the Reports window, kept up to date by triggers on
+# employee so a report reads a few hundred rows instead of aggregating the
+# whole table. birth_year 0 counts employees without a (valid) dob.
+
+BIRTH_YEAR_SQL = "IFNULL(CAST(substr({dob}, 1, 4) AS INTEGER), 0)"
+
+STATS_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS employee_stats_type (
+        user_type INTEGER PRIMARY KEY,
+        count INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS employee_stats_birth_year (
+        birth_year INTEGER PRIMARY KEY,
+        count INTEGER NOT NULL
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS employee_stats_ai AFTER INSERT ON employee BEGIN
+        INSERT INTO employee_stats_type (user_type, count) VALUES (new.user_type, 1)
+            ON CONFLICT(user_type) DO UPDATE SET count = count + 1;
+        INSERT INTO employee_stats_birth_year (birth_year, count)
+            VALUES ({BIRTH_YEAR_SQL.format(dob="new.dob")}, 1)
+            ON CONFLICT(birth_year) DO UPDATE SET count = count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS employee_stats_ad AFTER DELETE ON employee BEGIN
+        UPDATE employee_stats_type SET count = count - 1
+            WHERE user_type = old.user_type;
+        UPDATE employee_stats_birth_year SET count = count - 1
+            WHERE birth_year = {BIRTH_YEAR_SQL.format(dob="old.dob")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS employee_stats_au AFTER UPDATE OF dob, user_type ON employee
+    WHEN old.dob IS NOT new.dob OR old.user_type IS NOT new.user_type
+    BEGIN
+        UPDATE employee_stats_type SET count = count - 1
+            WHERE user_type = old.user_type;
+        INSERT INTO employee_stats_type (user_type, count) VALUES (new.user_type, 1)
+            ON CONFLICT(user_type) DO UPDATE SET count = count + 1;
+        UPDATE employee_stats_birth_year SET count = count - 1
+            WHERE birth_year = {BIRTH_YEAR_SQL.format(dob="old.dob")};
+        INSERT INTO employee_stats_birth_year (birth_year, count)
+            VALUES ({BIRTH_YEAR_SQL.format(dob="new.dob")}, 1)
+            ON CONFLICT(birth_year) DO UPDATE SET count = count + 1;
+    END
+    """,
+]
+
+# Recount everything from employee (after a bulk load done without the
+# triggers, or writes made with the triggers dropped)
+STATS_REBUILD_STATEMENTS = [
+    "DELETE FROM employee_stats_type",
+    "DELETE FROM employee_stats_birth_year",
+    """
+    INSERT INTO employee_stats_type (user_type, count)
+    SELECT user_type, COUNT(*) FROM employee GROUP BY user_type
+    """,
+    f"""
+    INSERT INTO employee_stats_birth_year (birth_year, count)
+    SELECT {BIRTH_YEAR_SQL.format(dob="dob")} AS birth_year, COUNT(*)
+    FROM employee GROUP BY birth_year
+    """,
+]
+
+
+# ---------- Schema Migrations ----------
+#
+# Each migration is a list of SQL statements. PRAGMA user_version stores
+# how many migrations have been applied, so each one runs exactly once.
+
+MIGRATIONS = [
+    # 1: B-tree indexes for the common search filters
+    [
+        "CREATE INDEX IF NOT EXISTS idx_employee_dob ON employee (dob)",
+        "CREATE INDEX IF NOT EXISTS idx_employee_user_type ON employee (user_type)",
+        # NOCASE matches LIKE's case-insensitivity, so 'jo%' can use the index
+        "CREATE INDEX IF NOT EXISTS idx_employee_name ON employee (name COLLATE NOCASE)",
+    ],
+    # 2: dob + user_type together. Without planner stats SQLite may pick the
+    # low-selectivity user_type index for this combination; one composite
+    # index serves both dob-only and dob+user_type searches.
+    [
+        "CREATE INDEX IF NOT EXISTS idx_employee_dob_type ON employee (dob, user_type)",
+        "DROP INDEX IF EXISTS idx_employee_dob",
+    ],
+    # 3: sorting the results grid by dob. NULL dobs are stored as '' in the
+    # index so keyset paging can compare them like any other value; name
+    # and user_type sorts use the indexes from migration 1.
+    [
+        "CREATE INDEX IF NOT EXISTS idx_employee_dob_sort ON employee (IFNULL(dob, ''))",
+    ],
+    # 4: summary tables for the Reports window, filled from existing rows
+    STATS_STATEMENTS + STATS_REBUILD_STATEMENTS,
+]
+
+# Optional full-text index on employee.name. The trigram tokenizer matches
+# any 3+ character substring, which keeps the old LIKE '%name%' behavior
+# without scanning the whole table. Applied separately because older SQLite
+# builds may lack FTS5 or the trigram tokenizer.
+FTS_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS employee_fts USING fts5(
+        name, content='employee', content_rowid='emp_id', tokenize='trigram'
+    )
+    """,
+    # Keep the FTS table in sync with employee
+    """
+    CREATE TRIGGER IF NOT EXISTS employee_fts_ai AFTER INSERT ON employee BEGIN
+        INSERT INTO employee_fts (rowid, name) VALUES (new.emp_id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS employee_fts_ad AFTER DELETE ON employee BEGIN
+        INSERT INTO employee_fts (employee_fts, rowid, name)
+        VALUES ('delete', old.emp_id, old.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS employee_fts_au AFTER UPDATE OF name ON employee BEGIN
+        INSERT INTO employee_fts (employee_fts, rowid, name)
+        VALUES ('delete', old.emp_id, old.name);
+        INSERT INTO employee_fts (rowid, name) VALUES (new.emp_id, new.name);
+    END
+    """,
+    # Index rows that existed before the FTS table was created
+    "INSERT INTO employee_fts (employee_fts) VALUES ('rebuild')",
+]
+
+# Names with fewer characters than this can't use the trigram index
+FTS_MIN_CHARS = 3
+
+
+def migrate(conn: sqlite3.Connection):
+    """Apply any migrations that have not run yet on this database."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= len(MIGRATIONS) and has_fts(conn):
+        return
+
+    conn.execute("BEGIN")
+    try:
+        for statements in MIGRATIONS[version:]:
+            for sql in statements:
+                conn.execute(sql)
+
+        if not has_fts(conn):
+            conn.execute("SAVEPOINT fts")
+            try:
+                for sql in FTS_STATEMENTS:
+                    conn.execute(sql)
+                conn.execute("RELEASE fts")
+            except sqlite3.OperationalError:
+                # FTS5/trigram not available: search falls back to LIKE
+                conn.execute("ROLLBACK TO fts")
+                conn.execute("RELEASE fts")
+
+        # PRAGMA does not accept parameters
+        conn.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def rebuild_stats(conn: sqlite3.Connection):
+    """Recount the report summary tables from the employee table."""
+    with conn:
+        for sql in STATS_REBUILD_STATEMENTS:
+            conn.execute(sql)
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    """Returns True if the employee_fts full-text table exists."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'employee_fts'"
+    ).fetchone()
+    return row is not None
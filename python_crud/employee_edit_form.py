@@ -8,60 +8,78 @@ from tkinter import ttk
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Local imports
-import emp_db
-import user_type_db
+import emp_db_async
+import emp_record
+import tk_async
 import ui_util
-import parse_util
 
 # ---------- Save Handler (Insert or Update) ----------
 
 
-def save_employee(emp_id, name_var, dob_var, user_type_var, win, message_text):
-    """Handles saving or updating the employee form."""
+def save_employee(
+    emp_id, name_var, dob_var, user_type_var, win, message_text, on_saved=None
+):
+    """
+    Handles saving or updating the employee form.
+    on_saved(emp_id) is called after an update succeeds.
+    """
 
     # Clear previous status or error messages
     ui_util.set_text_readonly(message_text, "")
 
-    # --- Get and clean input values ---
-    name = parse_util.str_or_none(name_var.get())
-    dob, dob_parsed = parse_util.try_parse_date(dob_var.get())
-    user_type, type_parsed = parse_util.try_parse_int(user_type_var.get())
-
-    # --- Validate fields ---
-    errors = []
-
-    if not name:
-        errors.append("Name is required.")
-
-    if not type_parsed:
-        errors.append("User Type is invalid.")
-    elif user_type is None:
-        errors.append("User Type is required.")
-
-    if dob is not None and not dob_parsed:
-        errors.append("Date of Birth is invalid.")
+    # --- Parse and validate all fields in one pass ---
+    (name, dob, user_type), errors = emp_record.parse_employee(
+        {"name": name_var.get(), "dob": dob_var.get(), "user_type": user_type_var.get()}
+    )
 
     if errors:
         # Show validation errors in message text area
-        ui_util.set_text_readonly(message_text, "\n".join(errors))
+        ui_util.set_text_readonly(message_text, "\n".join(message for _, message in errors))
+        return
+
+    # Ignore extra clicks while a save is already in flight
+    if getattr(win, "saving", False):
         return
+    win.saving = True
 
-    # --- Save or update logic ---
+    # --- Save or update logic (runs on the async DB layer) ---
     if emp_id is None:
         # Insert new employee
-        err = emp_db.insert_employee(name, dob, user_type)
+        coro = emp_db_async.insert_employee(name, dob, user_type)
         success_msg = "Employee added successfully!"
     else:
         # Update existing employee
-        err = emp_db.update_employee(emp_id, name, dob, user_type)
+        coro = emp_db_async.update_employee(emp_id, name, dob, user_type)
         success_msg = "Employee updated successfully!"
 
+    ui_util.set_text_readonly(message_text, "Saving...")
+    tk_async.run(
+        coro,
+        on_done=lambda err: on_save_done(
+            err, emp_id, success_msg, win, message_text, on_saved
+        ),
+        on_error=lambda e: on_save_done(
+            str(e), emp_id, success_msg, win, message_text, on_saved
+        ),
+    )
+
+
+def on_save_done(err, emp_id, success_msg, win, message_text, on_saved):
+    """Show the result of a save (called on the Tk thread)."""
+    if not err and emp_id is not None and on_saved is not None:
+        on_saved(emp_id)  # Let the opener refresh its copy of the row
+
+    if not win.winfo_exists():
+        return  # Form was closed while saving
+
     # --- Handle DB operation result ---
     if err:
+        win.saving = False  # Let the user fix the input and try again
         ui_util.set_text_readonly(message_text, err)
     else:
         ui_util.set_text_readonly(message_text, success_msg)
-        # Close the form window after short delay
+        # Close the form window after short delay; saving stays True until
+        # then so a second click can't insert the row twice
         win.after(1000, win.destroy)
 
 
@@ -74,8 +92,12 @@ def open_edit_form(
     name: str | None = None,
     dob: date | None = None,
     user_type: int | None = None,
+    on_saved=None,
 ):
-    """Creates the Add/Edit Employee popup form."""
+    """
+    Creates the Add/Edit Employee popup form.
+    on_saved(emp_id) is called after an existing employee is updated.
+    """
 
     is_edit = emp_id is not None
     win = tk.Toplevel(parent)
@@ -125,7 +147,7 @@ def open_edit_form(
         win,
         text=action_label,
         command=lambda: save_employee(
-            emp_id, name_var, dob_var, user_type_var, win, message_text
+            emp_id, name_var, dob_var, user_type_var, win, message_text, on_saved
         ),
     )
     save_btn.grid(row=4, column=0, columnspan=2, pady=20)
@@ -1,63 +1,132 @@
 from datetime import date
 import os
 import sys
-import threading
 import tkinter as tk
-from tkinter import ttk
 
 # Add project root to the Python path for importing custom modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Local imports
 import emp_db
+import emp_db_async
+import query_runner
+import tk_async
 import ui_util
+import user_type_db
+import virtual_tree
 import parse_util
 import employee_edit_form
 
 
-# ---------- Search Execution (Threaded) ----------
+# ---------- Search Execution (Background) ----------
 
 
-def search(name_var, dob_var, user_type_var, tree, win, message_text):
-    """Trigger a background search and display 'Searching...'"""
+def search(
+    name_var, dob_var, user_type_var, quick_var, results, runner, message_text,
+    debounce=False,
+):
+    """
+    Start a background search and display 'Searching...'.
+    debounce=True (used while typing) waits for the user to pause first.
+    """
     ui_util.set_text_readonly(message_text, "Searching...")
 
-    # Run DB query in a separate thread to avoid freezing the UI
-    threading.Thread(
-        target=run_query,
-        args=(name_var, dob_var, user_type_var, tree, win, message_text),
-        daemon=True,
-    ).start()
-
-
-def run_query(name_var, dob_var, user_type_var, tree, win, message_text):
-    """Run the actual DB query and update the UI when done."""
     name = parse_util.str_or_none(name_var.get())
     dob = parse_util.date_or_none(dob_var.get())
     user_type = parse_util.int_or_none(user_type_var.get())
+    quick_filter = parse_util.str_or_none(quick_var.get())
+
+    # Remember the filters so later pages use the same query
+    filters = (name, dob, user_type, quick_filter)
+    order_by, descending = results.sort
+    results.filters = filters
+    results.has_more = False
+    results.loading = True
+
+    # The runner cancels any older query, so only the newest one renders
+    runner.submit(
+        lambda: emp_db.search_employees_page(
+            name, dob, user_type,
+            order_by=order_by, descending=descending, quick_filter=quick_filter,
+        ),
+        lambda rows: update_results(rows, results, message_text, first_page=True),
+        debounce=debounce,
+    )
+
+
+def load_next_page(results, runner, message_text):
+    """Fetch the page after the last loaded row, if there is one."""
+    if results.loading or not results.has_more:
+        return
+
+    results.loading = True
+    name, dob, user_type, quick_filter = results.filters
+    order_by, descending = results.sort
+    after_value, after_id = emp_db.page_key(results.data_source[-1], order_by)
+    runner.submit(
+        lambda: emp_db.search_employees_page(
+            name, dob, user_type, after_id,
+            order_by=order_by, descending=descending,
+            after_value=after_value, quick_filter=quick_filter,
+        ),
+        lambda rows: update_results(rows, results, message_text),
+    )
 
-    results = emp_db.search_employees(name, dob, user_type)
 
-    # Schedule update of TreeView in main thread
-    win.after(0, lambda: update_tree(results, tree, message_text))
+def sort_by(column, results, run_search):
+    """
+    Heading click: sort by this column, or flip the direction if it is
+    already the sort column. The database does the sorting, so the search
+    restarts from the first page.
+    """
+    order_by, descending = results.sort
+    descending = not descending if column == order_by else False
+    results.sort = (column, descending)
 
+    # Show the sort column and direction in the headings
+    for col in results.columns:
+        arrow = ""
+        if col == column:
+            arrow = " \u25bc" if descending else " \u25b2"
+        results.tree.heading(col, text=col + arrow)
 
-def update_tree(rows, tree, message_text):
-    """Clear and populate the TreeView with new results."""
-    tree.delete(*tree.get_children())
-    tree.data_source = rows
+    run_search()
 
-    if not rows:
-        # Display fallback row when no results
-        tree.insert("", "end", values=("No results found", "", "", ""))
+
+def update_results(rows, results, message_text, first_page=False):
+    """Show page one of a search, or append a later page."""
+    results.loading = False
+
+    if rows and rows[0][0] == "Error":
+        ui_util.set_text_readonly(message_text, rows[0][1])
+        return
+
+    # Only the visible rows are rendered, so page size doesn't matter here
+    if first_page:
+        results.set_data(list(rows))
+    else:
+        results.append_rows(rows)
+    results.has_more = len(rows) == emp_db.PAGE_SIZE
+
+    count = len(results.data_source)
+    if count == 0:
         ui_util.set_text_readonly(message_text, "No employees found.")
+    elif results.has_more:
+        ui_util.set_text_readonly(
+            message_text, f"{count} employee(s) loaded. Scroll down for more."
+        )
     else:
-        for row in rows:
-            emp_id, name, dob, user_type = row
-            formatted = (emp_id, name, dob, user_type)
-            tree.insert("", "end", values=formatted)
+        ui_util.set_text_readonly(message_text, f"{count} employee(s) found.")
+
+
+def format_row(row):
+    """Display values for one employee row."""
+    emp_id, name, dob, user_type = row
 
-        ui_util.set_text_readonly(message_text, f"{len(rows)} employee(s) found.")
+    # Resolve user type names from the cached lookup (no per-row query)
+    type_name = user_type_db.get_user_types().get(user_type)
+    type_label = f"{user_type} - {type_name}" if type_name else user_type
+    return (emp_id, name, dob, type_label)
 
 
 # ---------- Main Search Form UI ----------
@@ -69,19 +138,24 @@ def open_search_form(parent):
     win.title("Search Employees")
 
     # Center the window over the parent
-    w, h = 960, 480
+    w, h = 960, 520
     x, y = ui_util.compute_win_pos(w, h, parent)
     win.geometry(f"{w}x{h}+{x}+{y}")
 
     # Grid layout configuration
     win.columnconfigure(0, weight=1, minsize=200)
     win.columnconfigure(1, weight=2, minsize=400)
-    win.rowconfigure(5, weight=1)
+    win.rowconfigure(6, weight=1)
+
+    # --- Background query runner (one per window) ---
+    runner = query_runner.QueryRunner(win)
+    win.bind("<Destroy>", lambda e: runner.stop() if e.widget is win else None)
 
     # --- Form Variables ---
     name_var = tk.StringVar()
     dob_var = tk.StringVar()
     user_type_var = tk.StringVar()
+    quick_var = tk.StringVar()
 
     # --- Row 0: Message Display Area ---
     message_text = tk.Text(win, height=3, wrap="word", bg="gray", fg="white")
@@ -106,43 +180,52 @@ def open_search_form(parent):
     user_type_txt.grid(row=3, column=1, sticky="ew", padx=10, pady=5)
 
     # --- Row 4: Search Button ---
-    tk.Button(
-        win,
-        text="Search",
-        command=lambda: search(
-            name_var, dob_var, user_type_var, tree, win, message_text
-        ),
-    ).grid(row=4, column=0, columnspan=2, pady=10)
+    tk.Button(win, text="Search", command=lambda: run_search()).grid(
+        row=4, column=0, columnspan=2, pady=10
+    )
 
-    # --- Row 5: Results TreeView ---
-    frame = ttk.Frame(win)
-    frame.grid(row=5, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
-    frame.rowconfigure(0, weight=1)
-    frame.columnconfigure(0, weight=1)
+    # --- Row 5: Quick Filter (name, user type name or emp_id) ---
+    tk.Label(win, text="Quick Filter").grid(row=5, column=0, sticky="e", padx=10, pady=5)
+    quick_txt = tk.Entry(win, textvariable=quick_var)
+    quick_txt.grid(row=5, column=1, sticky="ew", padx=10, pady=5)
 
+    # --- Row 6: Results (virtual TreeView; loads the next page near the end) ---
     columns = ("emp_id", "name", "dob", "user_type")
-    tree = ttk.Treeview(frame, columns=columns, show="headings")
+    results = virtual_tree.VirtualTreeview(
+        win,
+        columns,
+        format_row=format_row,
+        on_near_end=lambda: load_next_page(results, runner, message_text),
+        row_key=lambda row: row[0],  # emp_id
+    )
+    results.grid(row=6, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+    results.filters = None
+    results.sort = ("emp_id", False)  # (column, descending)
+    results.has_more = False
+    results.loading = False
+
+    def run_search(debounce=False):
+        search(
+            name_var, dob_var, user_type_var, quick_var, results, runner,
+            message_text, debounce=debounce,
+        )
 
+    # --- Click a Heading to Sort (in the database, not in Tk) ---
     for col in columns:
-        tree.heading(col, text=col)
-        tree.column(col, anchor="w", width=120)
-
-    tree.grid(row=0, column=0, sticky="nsew")
-
-    # --- Vertical Scrollbar ---
-    scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
-    tree.configure(yscrollcommand=scrollbar.set)
-    scrollbar.grid(row=0, column=1, sticky="ns")
+        results.tree.heading(col, command=lambda c=col: sort_by(c, results, run_search))
 
     # --- Double-Click on Row to Edit Employee ---
-    tree.bind("<Double-1>", lambda e: on_treeview_double_click(e, win))
+    results.tree.bind(
+        "<Double-1>", lambda e: on_treeview_double_click(e, results, win)
+    )
 
     # --- Enter Key Triggers Search ---
-    for entry in (name_txt, dob_txt, user_type_txt):
-        entry.bind(
-            "<Return>",
-            lambda e: search(name_var, dob_var, user_type_var, tree, win, message_text),
-        )
+    for entry in (name_txt, dob_txt, user_type_txt, quick_txt):
+        entry.bind("<Return>", lambda e: run_search())
+
+    # --- Live Search While Typing (debounced) ---
+    for var in (name_var, dob_var, user_type_var, quick_var):
+        var.trace_add("write", lambda *args: run_search(debounce=True))
 
     name_txt.focus_set()
     return win
@@ -151,31 +234,36 @@ def open_search_form(parent):
 # ---------- Double-Click Row Handler ----------
 
 
-def on_treeview_double_click(event, win):
+def on_treeview_double_click(event, results, win):
     """Handle double-click on a TreeView row to open the edit form with original data."""
-    tree = event.widget
-    selected = tree.focus()
-    if not selected:
-        return
+    # The virtual tree maps the clicked item straight to its data row
+    index = results.index_of(results.tree.identify_row(event.y))
+    if index is None:
+        return  # Clicked the heading, empty space or the "No results found" row
 
-    values = tree.item(selected, "values")
-
-    # Guard: Skip dummy row
-    if values[0] == "No results found":
-        return
+    # Unpack and parse row from data_source
+    emp_id, name, dob, user_type = results.data_source[index]
+
+    # Open the edit form with pre-filled data; keep the results open and
+    # refresh just this row once it is saved
+    employee_edit_form.open_edit_form(
+        win.master,
+        emp_id,
+        name,
+        dob,
+        user_type,
+        on_saved=lambda saved_id: refresh_employee(saved_id, results),
+    )
 
-    # Find the index of the selected row
-    children = tree.get_children()
-    try:
-        index = children.index(selected)
-        row = tree.data_source[index] if hasattr(tree, "data_source") else values
-    except (ValueError, IndexError):
-        return  # Selected item not found in data_source
 
-    # Unpack and parse row from data_source
-    emp_id, name, dob, user_type = row
+def refresh_employee(emp_id, results):
+    """Reload one edited employee and redraw only that row."""
 
-    win.destroy()
+    def apply(row):
+        if not results.winfo_exists():
+            return  # Search window was closed meanwhile
+        index = results.index_of_key(emp_id)  # O(1) via the emp_id map
+        if index is not None and row is not None and row[0] != "Error":
+            results.update_row(index, row)
 
-    # Open the edit form with pre-filled data
-    employee_edit_form.open_edit_form(win.master, emp_id, name, dob, user_type)
+    tk_async.run(emp_db_async.get_employee(emp_id), on_done=apply)
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+
+# Defaults for the employee search cache
+MAX_ENTRIES = 256
+TTL_SECONDS = 60.0
+
+
+class QueryCache:
+    """
+    A small thread-safe LRU cache for query results.
+
+    - At most max_size entries; the least recently used one is evicted.
+    - Entries expire ttl_seconds after they were stored.
+    - Every entry remembers the generation it was stored under. Calling
+      invalidate() bumps the generation, which makes every existing entry
+      stale in O(1) without walking the cache.
+    """
+
+    def __init__(self, max_size: int = MAX_ENTRIES, ttl_seconds: float = TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+
+        self._entries = OrderedDict()  # key -> (generation, expires_at, value)
+        self._lock = threading.Lock()
+
+        # Counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """Returns (True, value) on a hit, or (False, None) on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generation, expires_at, value = entry
+                if generation == self.generation and time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)  # Mark as recently used
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]  # Stale or expired
+
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value, generation: int | None = None):
+        """
+        Stores a value. Pass the generation read BEFORE running the query
+        so a write that happened meanwhile is not hidden by this entry.
+        """
+        with self._lock:
+            if generation is None:
+                generation = self.generation
+            if generation != self.generation:
+                return  # Data changed while the query ran; don't cache
+
+            self._entries[key] = (
+                generation,
+                time.monotonic() + self.ttl_seconds,
+                value,
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self):
+        """Marks every cached entry as stale."""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters and current size for monitoring."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+            }
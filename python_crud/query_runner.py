@@ -0,0 +1,125 @@
+import threading
+import tkinter as tk
+import traceback
+
+import db_pool
+import emp_db
+
+# Default wait after the last keystroke before a debounced query runs
+DEBOUNCE_MS = 250
+
+
+class QueryRunner:
+    """
+    Runs DB queries for one window on a single background thread.
+
+    - submit() schedules a query; with debounce=True it waits until the
+      user stops typing for DEBOUNCE_MS.
+    - Only the newest query matters: an older query still waiting is
+      replaced, and one already running is cancelled with
+      sqlite3.Connection.interrupt().
+    - Every query gets a sequence number, and on_done is only called (on
+      the Tk thread) for the newest one, so stale results never overwrite
+      newer ones.
+    """
+
+    def __init__(self, widget, debounce_ms: int = DEBOUNCE_MS):
+        self.widget = widget
+        self.debounce_ms = debounce_ms
+
+        self.seq = 0  # Sequence number of the newest submitted query
+        self._after_id = None  # Pending debounce timer
+        self._pending = None  # (seq, fn, on_done) waiting for the worker
+        self._running_seq = None  # Sequence number of the query in progress
+        self._conn = None  # Worker thread's connection (for interrupt)
+        self._stopped = False
+        self._cond = threading.Condition()
+
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    # ---------- Tk Thread API ----------
+
+    def submit(self, fn, on_done, debounce: bool = False) -> int:
+        """
+        Queue fn() to run in the background; on_done(result) is called on
+        the Tk thread if no newer query was submitted meanwhile.
+        Returns the query's sequence number.
+        """
+        self.seq += 1
+        seq = self.seq
+
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+        if debounce:
+            self._after_id = self.widget.after(
+                self.debounce_ms, lambda: self._enqueue(seq, fn, on_done)
+            )
+        else:
+            self._enqueue(seq, fn, on_done)
+        return seq
+
+    def stop(self):
+        """Cancel everything and let the worker thread exit."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+        with self._cond:
+            self._stopped = True
+            self._pending = None
+            self._interrupt_running()
+            self._cond.notify()
+
+    def _enqueue(self, seq, fn, on_done):
+        self._after_id = None
+        with self._cond:
+            self._pending = (seq, fn, on_done)  # Replaces any older waiting query
+            self._interrupt_running()
+            self._cond.notify()
+
+    def _interrupt_running(self):
+        # Caller holds self._cond
+        if self._running_seq is not None and self._conn is not None:
+            self._conn.interrupt()
+
+    # ---------- Worker Thread ----------
+
+    def _worker(self):
+        self._conn = db_pool.get_connection(emp_db.DB_FILE)
+
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    break
+                seq, fn, on_done = self._pending
+                self._pending = None
+                self._running_seq = seq
+
+            try:
+                result = fn()
+            except Exception:
+                traceback.print_exc()
+                continue
+            finally:
+                with self._cond:
+                    self._running_seq = None
+
+            # Hand the result back to the Tk thread. Bind the loop variables
+            # now; the next query may rebind them before Tk runs the callback.
+            try:
+                self.widget.after(
+                    0, lambda s=seq, r=result, d=on_done: self._deliver(s, r, d)
+                )
+            except (RuntimeError, tk.TclError):
+                break  # Window (or Tk) is gone
+
+        db_pool.close_connection(emp_db.DB_FILE)
+
+    def _deliver(self, seq, result, on_done):
+        if seq == self.seq and not self._stopped:
+            on_done(result)
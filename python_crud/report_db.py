@@ -0,0 +1,90 @@
+import os
+import sys
+
+# Add project root to the Python path for importing custom modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local imports
+import emp_db
+import emp_schema
+from basic_func_logics.generation_age1 import GENERATIONS
+
+UNKNOWN = "Unknown"  # Employees without a birth date
+
+
+def generation_years(first: int | None, last: int | None) -> str:
+    """Label for a generation's birth years, e.g. '1965 - 1980'."""
+    return f"{first or '?'} - {last or '?'}"
+
+
+def load_report():
+    """
+    Reads the report statistics from the summary tables.
+    Returns a dict with:
+    - "total": number of employees,
+    - "user_types": [(user_type, name, count)],
+    - "birth_years": [(year or None, count)] sorted by year, None = no dob,
+    - "generations": [(generation, years label, count)] in GENERATIONS order.
+    Returns an error string if the database can't be read.
+    """
+    try:
+        conn = emp_db.get_connection()
+
+        # One read transaction so all three tables come from the same snapshot
+        with conn:
+            conn.execute("BEGIN")
+            user_types = conn.execute(
+                """
+                SELECT s.user_type, t.name, s.count
+                FROM employee_stats_type s
+                LEFT JOIN user_types t ON t.user_type = s.user_type
+                WHERE s.count > 0
+                ORDER BY s.user_type
+                """
+            ).fetchall()
+            years = conn.execute(
+                """
+                SELECT birth_year, count FROM employee_stats_birth_year
+                WHERE count > 0
+                ORDER BY birth_year
+                """
+            ).fetchall()
+    except Exception as e:
+        return str(e)
+
+    birth_years = [(year or None, count) for year, count in years]
+
+    # Generations are sums of whole birth years, so no extra table is needed
+    generations = []
+    for name, first, last in GENERATIONS:
+        count = sum(
+            n
+            for year, n in birth_years
+            if year is not None
+            and (first is None or year >= first)
+            and (last is None or year <= last)
+        )
+        generations.append((name, generation_years(first, last), count))
+    unknown = sum(n for year, n in birth_years if year is None)
+    if unknown:
+        generations.append((UNKNOWN, "", unknown))
+
+    return {
+        "total": sum(count for _, _, count in user_types),
+        "user_types": user_types,
+        "birth_years": birth_years,
+        "generations": generations,
+    }
+
+
+def rebuild_stats():
+    """
+    Recount the summary tables from the employee table.
+    Only needed after writes that bypassed the triggers.
+    Returns an error string or None.
+    """
+    try:
+        emp_schema.rebuild_stats(emp_db.get_connection())
+        return None
+    except Exception as e:
+        return str(e)
@@ -0,0 +1,199 @@
+import tkinter as tk
+from tkinter import ttk
+
+# Local imports
+import emp_db_async
+import report_db
+import tk_async
+import ui_util
+
+HISTOGRAM_BAR_COLOR = "steelblue"
+HISTOGRAM_LABEL_EVERY = 10  # Label the x axis every N birth years
+
+
+# ---------- Report Tables ----------
+
+
+def percent(count, total):
+    return f"{count * 100 / total:.1f}%" if total else ""
+
+
+def make_table(parent, columns, widths):
+    """A read-only Treeview with a vertical scrollbar, packed into parent."""
+    frame = ttk.Frame(parent)
+    frame.pack(fill="both", expand=True, padx=10, pady=10)
+    tree = ttk.Treeview(frame, columns=columns, show="headings")
+    for col, width in zip(columns, widths):
+        tree.heading(col, text=col)
+        tree.column(col, width=width, anchor="w")
+    scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    tree.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+    return tree
+
+
+def fill_table(tree, rows):
+    tree.delete(*tree.get_children())
+    for row in rows:
+        tree.insert("", "end", values=row)
+
+
+# ---------- Birth Year Histogram ----------
+
+
+def draw_histogram(canvas, birth_years):
+    """Bar chart of employees per birth year (employees without a dob are left out)."""
+    canvas.delete("all")
+    years = [(year, count) for year, count in birth_years if year is not None]
+    width, height = canvas.winfo_width(), canvas.winfo_height()
+    if not years or width < 50 or height < 50:
+        return
+
+    first, last = years[0][0], years[-1][0]
+    peak = max(count for _, count in years)
+    margin_x, margin_top, margin_bottom = 50, 10, 25
+    plot_w = width - margin_x - 10
+    plot_h = height - margin_top - margin_bottom
+    bar_w = plot_w / (last - first + 1)
+    base_y = margin_top + plot_h
+
+    for year, count in years:
+        x = margin_x + (year - first) * bar_w
+        bar_h = count * plot_h / peak
+        canvas.create_rectangle(
+            x, base_y - bar_h, x + max(1, bar_w - 1), base_y,
+            fill=HISTOGRAM_BAR_COLOR, outline="",
+        )
+
+    # Axes and labels
+    canvas.create_line(margin_x, base_y, margin_x + plot_w, base_y)
+    canvas.create_line(margin_x, margin_top, margin_x, base_y)
+    canvas.create_text(margin_x - 5, margin_top, text=f"{peak:,}", anchor="ne")
+    canvas.create_text(margin_x - 5, base_y, text="0", anchor="e")
+    for year in range(first - first % HISTOGRAM_LABEL_EVERY, last + 1, HISTOGRAM_LABEL_EVERY):
+        if year >= first:
+            x = margin_x + (year - first + 0.5) * bar_w
+            canvas.create_text(x, base_y + 4, text=str(year), anchor="n")
+
+
+# ---------- Main Reports Form UI ----------
+
+
+def open_reports_form(parent):
+    """Create and show the reports window."""
+    win = tk.Toplevel(parent)
+    win.title("Reports")
+
+    # Center the window over the parent
+    w, h = 720, 480
+    x, y = ui_util.compute_win_pos(w, h, parent)
+    win.geometry(f"{w}x{h}+{x}+{y}")
+
+    # --- Message Display Area ---
+    message_text = tk.Text(win, height=2, wrap="word", bg="gray", fg="white")
+    message_text.pack(fill="x", padx=10, pady=5)
+    message_text.configure(state="disabled")
+
+    # --- One tab per report ---
+    notebook = ttk.Notebook(win)
+    notebook.pack(fill="both", expand=True, padx=10, pady=5)
+
+    type_tab = ttk.Frame(notebook)
+    generation_tab = ttk.Frame(notebook)
+    year_tab = ttk.Frame(notebook)
+    notebook.add(type_tab, text="By User Type")
+    notebook.add(generation_tab, text="By Generation")
+    notebook.add(year_tab, text="By Birth Year")
+
+    type_tree = make_table(
+        type_tab, ("user_type", "name", "employees", "share"), (80, 200, 120, 80)
+    )
+    generation_tree = make_table(
+        generation_tab, ("generation", "born", "employees", "share"), (160, 120, 120, 80)
+    )
+    canvas = tk.Canvas(year_tab, bg="white", highlightthickness=0)
+    canvas.pack(fill="both", expand=True, padx=10, pady=10)
+
+    # --- Refresh / Recount Buttons ---
+    button_frame = ttk.Frame(win)
+    button_frame.pack(pady=10)
+    ttk.Button(
+        button_frame,
+        text="Refresh",
+        command=lambda: show_report(
+            type_tree, generation_tree, canvas, message_text
+        ),
+    ).pack(side="left", padx=5)
+    recount_btn = ttk.Button(button_frame, text="Recount")
+    recount_btn.configure(
+        command=lambda: recount_report(
+            recount_btn, type_tree, generation_tree, canvas, message_text
+        )
+    )
+    recount_btn.pack(side="left", padx=5)
+
+    # Summary tables are tiny, so the report loads in milliseconds
+    show_report(type_tree, generation_tree, canvas, message_text)
+    return win
+
+
+def show_report(type_tree, generation_tree, canvas, message_text):
+    """Load the statistics and fill all three tabs."""
+    report = report_db.load_report()
+    if isinstance(report, str):
+        ui_util.set_text_readonly(message_text, report)
+        return
+
+    total = report["total"]
+    ui_util.set_text_readonly(message_text, f"{total:,} employee(s).")
+
+    fill_table(
+        type_tree,
+        [
+            (user_type, name or "?", f"{count:,}", percent(count, total))
+            for user_type, name, count in report["user_types"]
+        ],
+    )
+    fill_table(
+        generation_tree,
+        [
+            (name, years, f"{count:,}", percent(count, total))
+            for name, years, count in report["generations"]
+        ],
+    )
+
+    # Redraw the histogram whenever the canvas is resized
+    canvas.bind(
+        "<Configure>", lambda e: draw_histogram(canvas, report["birth_years"])
+    )
+    draw_histogram(canvas, report["birth_years"])
+
+
+def recount_report(recount_btn, type_tree, generation_tree, canvas, message_text):
+    """
+    Rebuild the summary tables from the employee table on the DB writer
+    thread (a full recount), then reload the report.
+    """
+    recount_btn.state(["disabled"])  # One recount at a time
+    ui_util.set_text_readonly(message_text, "Recounting...")
+    tk_async.run(
+        emp_db_async.rebuild_stats(),
+        on_done=lambda err: on_recount_done(
+            err, recount_btn, type_tree, generation_tree, canvas, message_text
+        ),
+        on_error=lambda e: on_recount_done(
+            str(e), recount_btn, type_tree, generation_tree, canvas, message_text
+        ),
+    )
+
+
+def on_recount_done(err, recount_btn, type_tree, generation_tree, canvas, message_text):
+    """Show the result of a recount (called on the Tk thread)."""
+    if not recount_btn.winfo_exists():
+        return  # Window was closed while recounting
+    recount_btn.state(["!disabled"])
+    if err:
+        ui_util.set_text_readonly(message_text, err)
+        return
+    show_report(type_tree, generation_tree, canvas, message_text)
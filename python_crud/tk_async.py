@@ -0,0 +1,107 @@
+import asyncio
+import queue
+import threading
+import tkinter as tk
+import traceback
+
+# How often (ms) the Tk side checks for finished coroutines
+POLL_MS = 20
+
+
+class TkAsyncBridge:
+    """
+    Runs an asyncio event loop on a background thread and delivers the
+    results of coroutines back to the Tk event loop.
+
+    Tk widgets must only be touched from the Tk thread, so finished results
+    are put on a queue and picked up by a root.after() poll instead of
+    calling into Tk from the asyncio thread.
+    """
+
+    def __init__(self, root, poll_ms: int = POLL_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.loop = asyncio.new_event_loop()
+        self._done = queue.SimpleQueue()  # (future, on_done, on_error)
+        self._after_id = None
+
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+        self._poll()
+
+    def run(self, coro, on_done=None, on_error=None):
+        """
+        Schedule a coroutine on the asyncio loop.
+        on_done(result) or on_error(exception) is called on the Tk thread.
+        Returns a concurrent.futures.Future for the coroutine.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future.add_done_callback(lambda f: self._done.put((f, on_done, on_error)))
+        return future
+
+    def stop(self):
+        """Stop polling and shut the asyncio loop down."""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass  # Root window already destroyed
+            self._after_id = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _poll(self):
+        # Deliver every finished coroutine, then check again shortly
+        while True:
+            try:
+                future, on_done, on_error = self._done.get_nowait()
+            except queue.Empty:
+                break
+
+            try:
+                error = future.exception()
+                if error is None:
+                    if on_done is not None:
+                        on_done(future.result())
+                elif on_error is not None:
+                    on_error(error)
+                else:
+                    traceback.print_exception(error)
+            except Exception:
+                traceback.print_exc()  # Keep polling even if a callback fails
+
+        self._after_id = self.root.after(self.poll_ms, self._poll)
+
+
+# ---------- Application-wide Bridge ----------
+
+_bridge = None
+
+
+def start(root) -> TkAsyncBridge:
+    """Create the shared bridge for this Tk root (call once at startup)."""
+    global _bridge
+    if _bridge is None:
+        _bridge = TkAsyncBridge(root)
+    return _bridge
+
+
+def run(coro, on_done=None, on_error=None):
+    """Run a coroutine on the shared bridge; see TkAsyncBridge.run()."""
+    if _bridge is None:
+        coro.close()
+        raise RuntimeError("tk_async.start(root) has not been called.")
+    return _bridge.run(coro, on_done, on_error)
+
+
+def stop():
+    """Shut the shared bridge down (call once at exit)."""
+    global _bridge
+    if _bridge is not None:
+        _bridge.stop()
+        _bridge = None
@@ -1,21 +1,58 @@
-import sqlite3
+import threading
 
-DB_FILE = "employee.db"
+import db_pool
+
+DB_FILE = db_pool.DB_FILE
+
+# Process-wide lookup table: user_type code -> name.
+# Loaded on first use; call refresh_user_types() after the table changes.
+_user_types = None
+_user_types_lock = threading.Lock()
 
 def list_user_types():
     """
     Retrieves all user types from the user_types table.
     Returns a list of tuples containing user_type and name.
     """
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-
     try:
+        conn = db_pool.get_connection(DB_FILE)
         query = "SELECT user_type, name FROM user_types"
-        results = cursor.execute(query).fetchall()
+        results = conn.execute(query).fetchall()
         return results
     except Exception as e:
         return str(e)
-    finally:
-        cursor.close()
-        conn.close()
+
+def get_user_types() -> dict[int, str]:
+    """
+    Returns the cached {user_type: name} lookup, loading it once.
+    Returns an empty dict (and retries next time) if the table can't be read.
+    """
+    global _user_types
+
+    user_types = _user_types
+    if user_types is not None:
+        return user_types
+
+    with _user_types_lock:
+        if _user_types is None:
+            rows = list_user_types()
+            if isinstance(rows, str):
+                return {}  # DB error; don't cache it
+            _user_types = dict(rows)
+        return _user_types
+
+def refresh_user_types() -> dict[int, str]:
+    """Drops the cached lookup and reloads it from the database."""
+    global _user_types
+
+    with _user_types_lock:
+        _user_types = None
+    return get_user_types()
+
+def user_type_name(user_type: int | None) -> str | None:
+    """Returns the name for a user_type code, or None if unknown."""
+    return get_user_types().get(user_type)
+
+def is_valid_user_type(user_type: int | None) -> bool:
+    """O(1) check that user_type is a known code."""
+    return user_type in get_user_types()
@@ -0,0 +1,252 @@
+from tkinter import ttk
+
+# Fallback when the ttk theme does not report a Treeview row height
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualTreeview(ttk.Frame):
+    """
+    A Treeview that only creates items for the rows that fit on screen.
+
+    The rows live in a plain Python list (data_source). The Treeview holds a
+    fixed pool of items, one per visible line, and scrolling just rewrites
+    the values of those items. Rendering costs O(visible rows) Tk calls, no
+    matter if data_source has 100 rows or 1,000,000.
+
+    - format_row(row) turns a data row into the values shown (optional).
+    - on_near_end() is called when the view gets close to the last row,
+      so the caller can load the next page.
+    - row_key(row) gives each row a unique key (e.g. emp_id) so a row can
+      be found with index_of_key() in O(1).
+    """
+
+    def __init__(self, parent, columns, format_row=None, on_near_end=None,
+                 row_key=None, empty_text="No results found", near_end_rows=20,
+                 **kwargs):
+        super().__init__(parent, **kwargs)
+        self.columns = columns
+        self.format_row = format_row
+        self.row_key = row_key
+        self.on_near_end = on_near_end
+        self.empty_text = empty_text
+        self.near_end_rows = near_end_rows
+
+        self.data_source = []
+        self._index_of_key = {}  # row_key(row) -> index in data_source
+        self.offset = 0  # Index of the data row shown in the first slot
+        self.selected_index = None  # Selected data row (not slot)
+        self.show_empty = False
+
+        self._slots = []  # Pool of Treeview item ids, top to bottom
+        self._slot_of = {}  # Treeview item id -> slot number
+        self._slot_values = []  # Values last written to each slot
+        self._attached = 0  # How many slots are currently in the tree
+
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings",
+                                 selectmode="browse")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, anchor="w", width=120)
+
+        # The scrollbar tracks the position in data_source, not in the tree
+        self.scrollbar = ttk.Scrollbar(
+            self, orient="vertical", command=self._on_scrollbar
+        )
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        style_height = ttk.Style(self).lookup("Treeview", "rowheight")
+        self.row_height = int(style_height) if style_height else DEFAULT_ROW_HEIGHT
+
+        self.tree.bind("<Configure>", lambda e: self._resize_pool(e.height))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-3))  # X11 wheel up
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(3))  # X11 wheel down
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self.visible_rows))
+
+    # ---------- Data ----------
+
+    def set_data(self, rows, show_empty=True):
+        """Replace all rows and scroll back to the top."""
+        self.data_source = rows
+        self._index_of_key = {}
+        self._add_keys(0)
+        self.offset = 0
+        self.selected_index = None
+        self.show_empty = show_empty
+        self.refresh()
+
+    def append_rows(self, rows):
+        """Add rows at the end (e.g. the next page of results)."""
+        start = len(self.data_source)
+        self.data_source.extend(rows)
+        self._add_keys(start)
+        self.refresh()
+
+    def _add_keys(self, start):
+        if self.row_key is not None:
+            for index in range(start, len(self.data_source)):
+                self._index_of_key[self.row_key(self.data_source[index])] = index
+
+    def index_of_key(self, key):
+        """Data index of the row with this row_key, in O(1); None if absent."""
+        return self._index_of_key.get(key)
+
+    def update_row(self, index, row):
+        """Replace one data row and redraw it if it is on screen."""
+        self.data_source[index] = row
+        self.refresh_row(index)
+
+    def refresh_row(self, index):
+        """Redraw one data row if it is on screen (after editing it)."""
+        slot = index - self.offset
+        if 0 <= slot < self._attached:
+            self._write_slot(slot, self._display_values(index))
+
+    def index_of(self, item_id):
+        """Data index for a Treeview item id, in O(1); None if not a row."""
+        slot = self._slot_of.get(item_id)
+        if slot is None:
+            return None
+        index = self.offset + slot
+        return index if index < len(self.data_source) else None
+
+    # ---------- Scrolling ----------
+
+    @property
+    def visible_rows(self):
+        return max(1, len(self._slots))
+
+    def scroll_to(self, offset):
+        """Show data row `offset` in the first line."""
+        max_offset = max(0, len(self.data_source) - self.visible_rows)
+        offset = max(0, min(int(offset), max_offset))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.offset + rows)
+
+    def see(self, index):
+        """Scroll just enough to make data row `index` visible."""
+        if index < self.offset:
+            self.scroll_to(index)
+        elif index >= self.offset + self.visible_rows:
+            self.scroll_to(index - self.visible_rows + 1)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * len(self.data_source))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        # Windows/macOS report multiples of 120 per notch
+        self.scroll_by(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _move_selection(self, delta):
+        if not self.data_source:
+            return "break"
+        current = self.selected_index
+        if current is None:
+            current = self.offset - 1  # Nothing selected: start above the view
+        index = max(0, min(current + delta, len(self.data_source) - 1))
+        self.selected_index = index
+        self.see(index)
+        self.refresh()
+        return "break"
+
+    def _on_select(self, event):
+        # Use the selection, not focus: when refresh() clears the selection
+        # of a row scrolled off screen, focus still points at a reused slot
+        selection = self.tree.selection()
+        index = self.index_of(selection[0]) if selection else None
+        if index is not None:
+            self.selected_index = index
+
+    # ---------- Rendering ----------
+
+    def _resize_pool(self, height):
+        """Create or drop pool items so the pool matches the visible lines."""
+        # Leave room for the heading row
+        wanted = max(1, (height - self.row_height - 4) // self.row_height)
+        while len(self._slots) < wanted:
+            item = self.tree.insert("", "end", values=())
+            self.tree.detach(item)
+            self._slot_of[item] = len(self._slots)
+            self._slots.append(item)
+            self._slot_values.append(None)
+        while len(self._slots) > wanted:
+            item = self._slots.pop()
+            del self._slot_of[item]
+            self.tree.delete(item)
+            self._slot_values.pop()
+            self._attached = min(self._attached, len(self._slots))
+        self.scroll_to(self.offset)  # Clamp after a resize
+        self.refresh()
+
+    def _display_values(self, index):
+        row = self.data_source[index]
+        return tuple(self.format_row(row)) if self.format_row else tuple(row)
+
+    def _write_slot(self, slot, values):
+        # Skip the Tk call when the slot already shows these values
+        if self._slot_values[slot] != values:
+            self.tree.item(self._slots[slot], values=values)
+            self._slot_values[slot] = values
+
+    def _set_attached(self, count):
+        """Show the first `count` pool items, hide the rest."""
+        while self._attached < count:
+            self.tree.move(self._slots[self._attached], "", "end")
+            self._attached += 1
+        while self._attached > count:
+            self._attached -= 1
+            self.tree.detach(self._slots[self._attached])
+
+    def refresh(self):
+        """Redraw the visible window of data_source."""
+        if not self._slots:
+            return  # Not laid out yet; <Configure> will call back
+
+        total = len(self.data_source)
+        if total == 0:
+            if self.show_empty:
+                self._set_attached(1)
+                blanks = ("",) * (len(self.columns) - 1)
+                self._write_slot(0, (self.empty_text,) + blanks)
+            else:
+                self._set_attached(0)
+            self.tree.selection_set(())
+            self.scrollbar.set(0, 1)
+            return
+
+        count = min(len(self._slots), total - self.offset)
+        self._set_attached(count)
+        for slot in range(count):
+            self._write_slot(slot, self._display_values(self.offset + slot))
+
+        # Keep the highlight on the selected data row, wherever it scrolled
+        slot = -1 if self.selected_index is None else self.selected_index - self.offset
+        if 0 <= slot < count:
+            item = self._slots[slot]
+            if self.tree.selection() != (item,):
+                self.tree.selection_set(item)
+            self.tree.focus(item)
+        elif self.tree.selection():
+            self.tree.selection_set(())
+
+        self.scrollbar.set(self.offset / total, (self.offset + count) / total)
+
+        if self.on_near_end and self.offset + count >= total - self.near_end_rows:
+            self.on_near_end()
@@ -0,0 +1,244 @@
+"""
+Generate a large employee database for load and performance testing.
+
+- Realistic-ish names, birth dates and user type mix.
+- Deterministic: the same --seed always produces the same rows, no matter
+  how many --workers are used (rows are generated in fixed-size chunks,
+  each with its own seeded random generator).
+- Rows are generated in parallel worker processes and written by the main
+  process in large batched transactions (SQLite allows only one writer).
+- Indexes, the full-text table, the report summary tables and triggers
+  are created AFTER the load, which is much faster than maintaining them
+  row by row.
+
+Usage:
+    python python_sql/gen_employees.py --rows 10000000 --workers 4 --fast
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from multiprocessing import Pool
+
+# Make python_crud modules importable (for the schema migrations)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "python_crud"))
+
+import emp_schema
+
+# Rows per generated chunk. Fixed (not tied to --workers or --batch-size)
+# so the output only depends on --seed and --rows.
+CHUNK_SIZE = 10_000
+
+# Birth dates are generated relative to a fixed day so runs are repeatable
+REFERENCE_DATE = date(2025, 1, 1)
+
+# (name, relative weight) - common names show up more often
+FIRST_NAMES = [
+    ("James", 40), ("Mary", 38), ("John", 36), ("Patricia", 30), ("Robert", 34),
+    ("Jennifer", 32), ("Michael", 35), ("Linda", 26), ("David", 33), ("Elizabeth", 28),
+    ("William", 30), ("Barbara", 22), ("Richard", 25), ("Susan", 22), ("Joseph", 24),
+    ("Jessica", 24), ("Thomas", 22), ("Sarah", 25), ("Chris", 20), ("Karen", 18),
+    ("Daniel", 22), ("Nancy", 15), ("Matthew", 20), ("Lisa", 17), ("Anthony", 16),
+    ("Emily", 20), ("Mark", 15), ("Laura", 14), ("Alex", 12), ("Katie", 10),
+    ("Mike", 12), ("Jane", 10), ("Luke", 8), ("Loc", 4), ("Minh", 5),
+    ("Wei", 6), ("Priya", 6), ("Carlos", 8), ("Sofia", 8), ("Fatima", 5),
+]
+
+LAST_NAMES = [
+    ("Smith", 50), ("Johnson", 40), ("Williams", 35), ("Brown", 33), ("Jones", 32),
+    ("Garcia", 30), ("Miller", 28), ("Davis", 27), ("Rodriguez", 25), ("Martinez", 25),
+    ("Hernandez", 22), ("Lopez", 20), ("Gonzalez", 20), ("Wilson", 19), ("Anderson", 18),
+    ("Thomas", 17), ("Taylor", 17), ("Moore", 16), ("Jackson", 15), ("Martin", 15),
+    ("Lee", 15), ("Perez", 13), ("Thompson", 13), ("White", 12), ("Harris", 12),
+    ("Nguyen", 14), ("Tran", 8), ("Ha", 4), ("Pham", 5), ("Kim", 9),
+    ("Patel", 10), ("Chen", 10), ("Wang", 9), ("Singh", 8), ("Ali", 6),
+    ("Clark", 10), ("Lewis", 10), ("Walker", 9), ("Hall", 8), ("Young", 8),
+]
+
+# Most employees are engineers, few are administrators
+USER_TYPE_WEIGHTS = [
+    (1, 1),   # Administrator
+    (2, 9),   # Manager
+    (3, 5),   # HR
+    (4, 70),  # Engineer
+    (5, 15),  # Intern
+]
+
+USER_TYPES = {
+    1: "Administrator",
+    2: "Manager",
+    3: "HR",
+    4: "Engineer",
+    5: "Intern",
+}
+
+NULL_DOB_RATE = 0.05  # 5% of employees have no recorded birth date
+
+
+def _cumulative(pairs):
+    """Split (value, weight) pairs into values and cumulative weights."""
+    values, cum, total = [], [], 0
+    for value, weight in pairs:
+        total += weight
+        values.append(value)
+        cum.append(total)
+    return values, cum
+
+
+_FIRST, _FIRST_CUM = _cumulative(FIRST_NAMES)
+_LAST, _LAST_CUM = _cumulative(LAST_NAMES)
+_TYPES, _TYPES_CUM = _cumulative(USER_TYPE_WEIGHTS)
+
+
+# ---------- Row Generation (runs in worker processes) ----------
+
+
+def generate_chunk(args):
+    """
+    Generate rows [start, start + count) as (emp_id, name, dob, user_type).
+    Each chunk has its own seeded generator, so it can run anywhere.
+    """
+    seed, chunk_index, start, count = args
+    rng = random.Random(seed * 1_000_003 + chunk_index)
+
+    firsts = rng.choices(_FIRST, cum_weights=_FIRST_CUM, k=count)
+    lasts = rng.choices(_LAST, cum_weights=_LAST_CUM, k=count)
+    types = rng.choices(_TYPES, cum_weights=_TYPES_CUM, k=count)
+
+    rows = []
+    for i in range(count):
+        if rng.random() < NULL_DOB_RATE:
+            dob = None
+        else:
+            # Working-age employees: age ~ N(40, 11), clipped to 18..70
+            age = min(70.0, max(18.0, rng.gauss(40.0, 11.0)))
+            dob = (REFERENCE_DATE - timedelta(days=int(age * 365.25))).isoformat()
+        rows.append((start + i + 1, f"{firsts[i]} {lasts[i]}", dob, types[i]))
+    return rows
+
+
+def chunk_args(seed, total_rows):
+    """Yield the arguments for every chunk of the load."""
+    for chunk_index, start in enumerate(range(0, total_rows, CHUNK_SIZE)):
+        yield seed, chunk_index, start, min(CHUNK_SIZE, total_rows - start)
+
+
+# ---------- Database Setup ----------
+
+
+def create_tables(conn):
+    """Drop and recreate the tables WITHOUT indexes or triggers."""
+    conn.execute("DROP TABLE IF EXISTS employee_fts")
+    conn.execute("DROP TABLE IF EXISTS employee_stats_type")
+    conn.execute("DROP TABLE IF EXISTS employee_stats_birth_year")
+    conn.execute("DROP TABLE IF EXISTS employee")
+    conn.execute("DROP TABLE IF EXISTS user_types")
+    conn.execute("PRAGMA user_version = 0")  # emp_schema re-applies everything
+
+    conn.execute("""
+        CREATE TABLE employee (
+            emp_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            dob DATE,
+            user_type INTEGER NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE user_types (
+            user_type INTEGER PRIMARY KEY,
+            name TEXT NOT NULL
+        )
+    """)
+    conn.executemany("INSERT INTO user_types VALUES (?, ?)", USER_TYPES.items())
+    conn.commit()
+
+
+# ---------- Main ----------
+
+
+def generate(db_file, rows, seed=42, batch_size=100_000, workers=1, fast=False):
+    """Create db_file with `rows` generated employees. Returns elapsed seconds."""
+    start_time = time.perf_counter()
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA cache_size = -262144")  # ~256 MB page cache
+    if fast:
+        # No rollback journal and no fsync: a crash mid-load corrupts the
+        # file, which is fine for a throwaway test database
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+    create_tables(conn)
+
+    sql = "INSERT INTO employee (emp_id, name, dob, user_type) VALUES (?, ?, ?, ?)"
+    written = 0
+    pending = 0
+
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        chunks = chunk_args(seed, rows)
+        results = pool.imap(generate_chunk, chunks) if pool else map(generate_chunk, chunks)
+
+        conn.execute("BEGIN")
+        for chunk in results:
+            conn.executemany(sql, chunk)
+            written += len(chunk)
+            pending += len(chunk)
+
+            # Commit in large batches to bound the transaction size
+            if pending >= batch_size:
+                conn.commit()
+                conn.execute("BEGIN")
+                pending = 0
+                elapsed = time.perf_counter() - start_time
+                print(f"  {written:,} rows ({written / elapsed:,.0f} rows/sec)")
+        conn.commit()
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    load_seconds = time.perf_counter() - start_time
+    print(f"Loaded {written:,} rows in {load_seconds:.1f}s")
+
+    # Journal back on BEFORE migrating: migrate rolls back to a SAVEPOINT
+    # when FTS5 is missing, and rollback is undefined with journal_mode=OFF
+    conn.execute("PRAGMA journal_mode = WAL")
+
+    # Build indexes, full-text table, report statistics and triggers in one
+    # pass over the data
+    print("Building indexes and report statistics...")
+    emp_schema.migrate(conn)
+    conn.close()
+
+    total_seconds = time.perf_counter() - start_time
+    print(f"Done in {total_seconds:.1f}s ({written / total_seconds:,.0f} rows/sec overall)")
+    return total_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a large employee database.")
+    parser.add_argument("--db", default="employee.db", help="database file to (re)create")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of employees")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    parser.add_argument(
+        "--batch-size", type=int, default=100_000, help="rows per committed transaction"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="generator processes"
+    )
+    parser.add_argument(
+        "--fast", action="store_true", help="disable journaling and fsync during the load"
+    )
+    args = parser.parse_args()
+
+    print(f"Generating {args.rows:,} employees into {args.db} (seed={args.seed})")
+    generate(args.db, args.rows, args.seed, args.batch_size, args.workers, args.fast)
+
+
+if __name__ == "__main__":
+    main()
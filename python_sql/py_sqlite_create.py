@@ -6,8 +6,14 @@ from datetime import datetime, timedelta
 conn = sqlite3.connect('employee.db')
 cursor = conn.cursor()
 
-# Drop and recreate employee table
+# Drop and recreate employee table (plus its full-text index and report
+# summary tables). Resetting user_version makes python_crud/emp_schema.py
+# re-apply its indexes, triggers and statistics on the fresh table.
+cursor.execute("DROP TABLE IF EXISTS employee_fts")
+cursor.execute("DROP TABLE IF EXISTS employee_stats_type")
+cursor.execute("DROP TABLE IF EXISTS employee_stats_birth_year")
 cursor.execute("DROP TABLE IF EXISTS employee")
+cursor.execute("PRAGMA user_version = 0")
 cursor.execute('''
 CREATE TABLE IF NOT EXISTS employee (
     emp_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -28,15 +34,18 @@ def random_date(start_year=1970, end_year=2000):
     delta = end - start
     return (start + timedelta(days=random.randint(0, delta.days))).strftime('%Y-%m-%d')
 
-# Insert 50 dummy employees
+# Build 50 dummy employees, then insert them with one executemany() call
+employees = []
 for _ in range(50):
     full_name = f"{random.choice(first_names)} {random.choice(last_names)}"
     dob = random_date() if random.random() > 0.1 else None  # 10% chance dob is NULL
     user_type = random.randint(1, 5)  # User type code between 1–5
-    cursor.execute('''
-        INSERT INTO employee (name, dob, user_type)
-        VALUES (?, ?, ?)
-    ''', (full_name, dob, user_type))
+    employees.append((full_name, dob, user_type))
+
+cursor.executemany('''
+    INSERT INTO employee (name, dob, user_type)
+    VALUES (?, ?, ?)
+''', employees)
 
 # Drop and recreate user_types table with fixed codes
 cursor.execute("DROP TABLE IF EXISTS user_types")
@@ -56,8 +65,9 @@ coded_user_types = {
     5: "Intern"
 }
 
-for code, name in coded_user_types.items():
-    cursor.execute("INSERT INTO user_types (user_type, name) VALUES (?, ?)", (code, name))
+cursor.executemany(
+    "INSERT INTO user_types (user_type, name) VALUES (?, ?)", coded_user_types.items()
+)
 
 # Finalize changes and close connection
 conn.commit()
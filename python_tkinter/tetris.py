@@ -1,11 +1,24 @@
 import tkinter as tk
-import random
+import time
+
+# Local imports
+import tetris_ai
+import tetris_engine
+
 
 class Tetris:
-    COLS = 10
-    ROWS = 20
+    COLS = tetris_engine.COLS
+    ROWS = tetris_engine.ROWS
     CELL = 30
-    TICK_MS = 500  # base gravity (milliseconds between automatic drops)
+    AUTOPLAY_MS = 150  # delay between AI placements in autoplay mode
+    # Search on the Tk thread: depth 2 takes ~10 ms per piece serially, and
+    # waiting on a process pool forked from Tk is slower and blocks just the same
+    AUTOPLAY_WORKERS = 1
+
+    # Game loop (see start_loop)
+    FRAME_MS = 16           # render at most once per frame (~60 fps)
+    MAX_CATCHUP_TICKS = 5   # gravity ticks caught up per frame before dropping the backlog
+    STATS_MS = 500          # how often the status bar timing stats refresh
 
     # Editable key bindings
     # NOTE: Space rotates clockwise; hard drop is on Shift (left/right).
@@ -18,69 +31,10 @@ class Tetris:
         "hard_drop":   ["Shift_L", "Shift_R"],        # instant drop to bottom
         "pause":       ["p", "P"],
         "restart":     ["r", "R"],
+        "autoplay":    ["i", "I"],                    # toggle the AI player
     }
 
-    # Tetromino definitions as rotation states (1 = filled cell)
-    SHAPES = {
-        'I': [
-            [[1,1,1,1]],
-            [[1],[1],[1],[1]],
-        ],
-        'O': [
-            [[1,1],
-             [1,1]]
-        ],
-        'T': [
-            [[0,1,0],
-             [1,1,1]],
-            [[1,0],
-             [1,1],
-             [1,0]],
-            [[1,1,1],
-             [0,1,0]],
-            [[0,1],
-             [1,1],
-             [0,1]],
-        ],
-        'S': [
-            [[0,1,1],
-             [1,1,0]],
-            [[1,0],
-             [1,1],
-             [0,1]],
-        ],
-        'Z': [
-            [[1,1,0],
-             [0,1,1]],
-            [[0,1],
-             [1,1],
-             [1,0]],
-        ],
-        'J': [
-            [[1,0,0],
-             [1,1,1]],
-            [[1,1],
-             [1,0],
-             [1,0]],
-            [[1,1,1],
-             [0,0,1]],
-            [[0,1],
-             [0,1],
-             [1,1]],
-        ],
-        'L': [
-            [[0,0,1],
-             [1,1,1]],
-            [[1,0],
-             [1,0],
-             [1,1]],
-            [[1,1,1],
-             [1,0,0]],
-            [[1,1],
-             [0,1],
-             [0,1]],
-        ],
-    }
+    SHAPES = tetris_engine.SHAPES
 
     COLORS = {
         'I': "#00FFFF",
@@ -92,10 +46,18 @@ class Tetris:
         'L': "#FFA500",
     }
 
-    # Base points for line clears (before level multiplier)
-    LINE_POINTS = [0, 100, 300, 500, 800]  # 0..4 lines
+    # Canvas colors (an "empty" block is drawn in the background color)
+    BOARD_BG = "#111"
+    PREVIEW_BG = "#222"
+    GRID_LINE = "#333"
+    FLASH_OUTLINE = "#FFF"
+    PREVIEW_SLOTS = 3      # pieces shown in the preview
+    PREVIEW_SLOT_ROWS = 6  # preview cells per slot (vertically)
+
+    def __init__(self, seed=None):
+        # All game state and rules live in the headless engine
+        self.engine = tetris_engine.TetrisEngine(seed)
 
-    def __init__(self):
         self.root = tk.Tk()
         self.root.title("Tetris")
         self.root.resizable(False, False)
@@ -103,9 +65,14 @@ class Tetris:
         w = self.COLS * self.CELL
         h = self.ROWS * self.CELL
 
-        self.canvas = tk.Canvas(self.root, width=w, height=h, bg="#111")
+        self.canvas = tk.Canvas(self.root, width=w, height=h, bg=self.BOARD_BG)
         self.canvas.grid(row=0, column=0, padx=8, pady=8)
 
+        # Status bar: frame/tick timing stats
+        self.timing_var = tk.StringVar()
+        tk.Label(self.root, textvariable=self.timing_var, font=("Consolas", 9), fg="#888",
+                 anchor="w").grid(row=1, column=0, columnspan=2, sticky="we", padx=8, pady=(0, 4))
+
         self.side = tk.Frame(self.root)
         self.side.grid(row=0, column=1, sticky="ns")
 
@@ -121,7 +88,7 @@ class Tetris:
         # NEXT PREVIEW (now shows next 3 pieces stacked vertically)
         tk.Label(self.side, text="Next (x3):", font=("Consolas", 12)).pack(pady=(10,2))
         # Height = three 6xCELL boxes + small spacing
-        self.preview_canvas = tk.Canvas(self.side, width=6*self.CELL, height=3*6*self.CELL + 8, bg="#222")
+        self.preview_canvas = tk.Canvas(self.side, width=6*self.CELL, height=3*6*self.CELL + 8, bg=self.PREVIEW_BG)
         self.preview_canvas.pack(pady=4)
 
         tk.Label(self.side, textvariable=self.status_var, font=("Consolas", 11),
@@ -138,7 +105,8 @@ class Tetris:
                 "↑ / X / Space: Rotate CW\n"
                 "Z: Rotate CCW\n"
                 "Shift: Hard drop\n"
-                "P: Pause, R: Restart"
+                "P: Pause, R: Restart\n"
+                "I: AI autoplay"
             ),
             justify="left"
         ).pack(anchor="w")
@@ -148,9 +116,17 @@ class Tetris:
         self.btn_frame.pack(pady=10)
         tk.Button(self.btn_frame, text="Restart", command=self.restart).grid(row=0, column=0, padx=4)
         tk.Button(self.btn_frame, text="Pause/Resume", command=self.toggle_pause).grid(row=0, column=1, padx=4)
+        tk.Button(self.btn_frame, text="Autoplay", command=self.toggle_autoplay).grid(row=1, column=0, columnspan=2, pady=4)
+
+        # AI player, created on first use (it starts a process pool)
+        self.autoplay = False
+        self.autoplayer = None
+        self.autoplay_job = None
 
+        self.create_cell_items()
         self.bind_keys()
         self.restart()
+        self.start_loop()
 
     # -------------------- Input Binding --------------------
     def bind_keys(self):
@@ -172,103 +148,38 @@ class Tetris:
         bind_list(self.KEYS["hard_drop"],   lambda e: self.hard_drop())
         bind_list(self.KEYS["pause"],       lambda e: self.toggle_pause())
         bind_list(self.KEYS["restart"],     lambda e: self.restart())
+        bind_list(self.KEYS["autoplay"],    lambda e: self.toggle_autoplay())
 
     # -------------------- Game Lifecycle --------------------
     def restart(self):
-        # Logical playfield: None = empty, otherwise a color string
-        self.grid = [[None for _ in range(self.COLS)] for _ in range(self.ROWS)]
-        self.score = 0
-        self.lines_cleared = 0
-        self.level = 1
-        self.gravity = self.TICK_MS
+        self.engine.reset()
+        self.gravity = tetris_engine.gravity_ms(self.engine.level)
         self.paused = False
-        self.game_over = False
 
         # Rotation feedback (thin white outline for a few frames)
         self.rotate_flash = 0
 
-        # NEXT QUEUE (3 upcoming pieces). We use weighted sampling by level.
-        self.next_queue = [self.weighted_random_piece() for _ in range(3)]
-
         self.status_var.set("Ready. Good luck!")
-        self.spawn_new_piece()          # pulls first item from next_queue
-        self.update_side()
-        self.draw()
-        self.schedule_tick()
+        self.after_spawn()
+        self.needs_draw = True
+        self.next_tick_at = time.monotonic() + self.gravity / 1000
+        if self.autoplay:
+            self.schedule_autoplay()
 
-    # -------------------- Level-Aware Spawning --------------------
-    def piece_weights(self):
-        """
-        Return weights for each piece type based on current level.
-        Slightly favors S/Z/J/L as levels rise; slightly reduces I/O.
-        """
-        L = max(1, self.level)
-        inc = 1.0 + 0.05 * (L - 1)             # +5% per level for S/Z/J/L
-        dec = max(0.4, 1.1 - 0.03 * (L - 1))   # -3% per level for I/O (min 0.4)
-        return {
-            'I': dec,
-            'O': dec,
-            'T': 1.0,
-            'S': inc,
-            'Z': inc,
-            'J': inc,
-            'L': inc,
-        }
-
-    def weighted_random_piece(self):
-        """Choose next piece using level-aware weights."""
-        w = self.piece_weights()
-        types = list(self.SHAPES.keys())
-        probs = [w[t] for t in types]
-        total = sum(probs)
-        r = random.uniform(0, total)
-        upto = 0.0
-        for t, p in zip(types, probs):
-            if upto + p >= r:
-                return {'type': t, 'rot': 0, 'x': 0, 'y': 0}
-            upto += p
-        return {'type': random.choice(types), 'rot': 0, 'x': 0, 'y': 0}
-
-    def spawn_new_piece(self):
-        """
-        Pull the next piece from the queue, center it based on width,
-        then push a freshly-weighted piece to the end of the queue.
-        """
-        self.current = self.next_queue.pop(0)
-        self.current['rot'] = 0
-
-        # Center horizontally by actual piece width for nicer spawn
-        mat0 = self.SHAPES[self.current['type']][0]
-        piece_w = len(mat0[0])
-        self.current['x'] = (self.COLS - piece_w) // 2
-        self.current['y'] = 0
-
-        # Refill queue tail
-        self.next_queue.append(self.weighted_random_piece())
-
-        # If we collide at spawn, it's game over
-        if self.collides(self.current['x'], self.current['y'], self.current['rot']):
-            self.game_over = True
-            self.set_title("Game Over! Press Restart.")
-            self.status_var.set("Game Over.")
-        self.update_side()
+    @property
+    def game_over(self):
+        return self.engine.game_over
 
     # -------------------- Movement & Rotation --------------------
     def rotate(self, dir_):
         """Rotate current piece with simple wall-kick. dir_=+1 (CW), -1 (CCW)."""
         if self.paused or self.game_over:
             return
-        t = self.current['type']
-        rot = (self.current['rot'] + dir_) % len(self.SHAPES[t])
-        # Try in-place, then nudge left/right (naive wall-kick)
-        for dx in (0, -1, 1, -2, 2):
-            if not self.collides(self.current['x'] + dx, self.current['y'], rot):
-                self.current['rot'] = rot
-                self.current['x'] += dx
-                self.rotate_flash = 6
-                self.status_var.set("Rotated CW" if dir_ > 0 else "Rotated CCW")
-                self.draw()
-                return
+        if self.engine.rotate(dir_):
+            self.rotate_flash = 6
+            self.status_var.set("Rotated CW" if dir_ > 0 else "Rotated CCW")
+            self.needs_draw = True
+            return
         self.root.bell()
         self.status_var.set("Rotation blocked")
 
@@ -276,174 +187,290 @@ class Tetris:
         """Attempt to move active piece by (dx, dy)."""
         if self.paused or self.game_over:
             return
-        nx, ny = self.current['x'] + dx, self.current['y'] + dy
-        if not self.collides(nx, ny, self.current['rot']):
-            self.current['x'], self.current['y'] = nx, ny
-            self.draw()
+        if self.engine.move(dx, dy):
+            self.needs_draw = True
 
     def soft_drop(self):
         """One-row drop; if blocked, lock the piece."""
         if self.paused or self.game_over:
             return
-        if not self.step_down():
-            self.lock_piece()
+        self.gravity_step()
 
     def hard_drop(self):
         """Instantly drop to the floor; reward small points per row * level."""
         if self.paused or self.game_over:
             return
-        dropped = 0
-        while not self.collides(self.current['x'], self.current['y'] + 1, self.current['rot']):
-            self.current['y'] += 1
-            dropped += 1
-        if dropped:
-            self.score += dropped * self.level
-        self.lock_piece()
-
-    # -------------------- Gravity / Tick --------------------
-    def schedule_tick(self):
-        if not self.game_over:
-            self.root.after(self.gravity, self.tick)
-
-    def tick(self):
-        # Gravity step each tick (unless paused); then reschedule
+        level = self.engine.level
+        self.engine.hard_drop()
+        self.after_lock(level)
+
+    # -------------------- Game Loop --------------------
+    # One fixed-timestep loop drives the game on a monotonic clock. Gravity
+    # ticks fall due every self.gravity ms counted from when the previous
+    # tick was DUE, not from when it ran, so slow ticks or frames never slow
+    # gravity down; missed ticks are caught up on the next frame (at most
+    # MAX_CATCHUP_TICKS, then the backlog is dropped). Inputs and ticks only
+    # mark the board dirty and the loop draws it at most once per frame, so
+    # the logic rate and the render rate are independent.
+    def start_loop(self):
+        now = time.monotonic()
+        self.next_frame_at = now
+        self.reset_timing_stats(now)
+        self.loop()
+
+    def loop(self):
+        now = time.monotonic()
+        self.run_due_ticks(now)
+
+        if self.needs_draw:
+            self.needs_draw = False
+            start = time.perf_counter()
+            self.draw()
+            self.stats_draw_max = max(self.stats_draw_max, time.perf_counter() - start)
+            self.stats_frames += 1
+
+        if now >= self.stats_until:
+            self.update_timing_stats(now)
+
+        # Next frame on the fixed frame clock; if we fell behind, skip the
+        # missed frames instead of rendering them back to back
+        self.next_frame_at += self.FRAME_MS / 1000
+        if self.next_frame_at < now:
+            self.next_frame_at = now + self.FRAME_MS / 1000
+        delay = max(1, round((self.next_frame_at - time.monotonic()) * 1000))
+        self.root.after(delay, self.loop)
+
+    def run_due_ticks(self, now):
+        """Run every gravity tick that has fallen due by now."""
         if self.paused or self.game_over:
-            self.schedule_tick()
+            # Time spent paused is not caught up on resume
+            self.next_tick_at = now + self.gravity / 1000
             return
-        if not self.step_down():
-            self.lock_piece()
+        ticks = 0
+        while now >= self.next_tick_at and not self.game_over:
+            if ticks == self.MAX_CATCHUP_TICKS:
+                self.stats_dropped += 1
+                self.next_tick_at = now + self.gravity / 1000
+                break
+            late = now - self.next_tick_at
+            self.stats_late_total += late
+            self.stats_late_max = max(self.stats_late_max, late)
+            self.next_tick_at += self.gravity / 1000
+            self.tick()
+            ticks += 1
+        self.stats_ticks += ticks
+
+    def tick(self):
+        # Gravity step (logic only; the loop draws)
+        self.gravity_step()
         if self.rotate_flash > 0:
             self.rotate_flash -= 1
-        self.schedule_tick()
-
-    def step_down(self):
-        """Internal helper: try moving active piece down by 1 row."""
-        if not self.collides(self.current['x'], self.current['y'] + 1, self.current['rot']):
-            self.current['y'] += 1
-            self.draw()
-            return True
-        return False
-
-    # -------------------- Collision / Lock / Clear --------------------
-    def shape_matrix(self, t, r):
-        return self.SHAPES[t][r]
+            self.needs_draw = True
+
+    def reset_timing_stats(self, now):
+        self.stats_since = now
+        self.stats_until = now + self.STATS_MS / 1000
+        self.stats_frames = 0
+        self.stats_draw_max = 0.0
+        self.stats_draw_frames = self.frame_count  # draw() totals at the window start
+        self.stats_draw_time = self.frame_time
+        self.stats_ticks = 0
+        self.stats_late_total = 0.0
+        self.stats_late_max = 0.0
+        self.stats_dropped = 0
+
+    def update_timing_stats(self, now):
+        """Show frame/tick timing for the last STATS_MS in the status bar."""
+        seconds = now - self.stats_since
+        frames = self.frame_count - self.stats_draw_frames
+        draw_avg = (self.frame_time - self.stats_draw_time) / frames if frames else 0.0
+        ticks = self.stats_ticks
+        late_avg = self.stats_late_total / ticks if ticks else 0.0
+        self.timing_var.set(
+            f"{self.stats_frames / seconds:4.0f} fps  "
+            f"draw {draw_avg * 1000:.2f}/{self.stats_draw_max * 1000:.2f} ms  "
+            f"{ticks / seconds:4.1f} ticks/s @ {self.gravity} ms  "
+            f"late {late_avg * 1000:.1f}/{self.stats_late_max * 1000:.1f} ms"
+            + (f"  dropped {self.stats_dropped}" if self.stats_dropped else "")
+        )
+        self.reset_timing_stats(now)
+
+    def gravity_step(self):
+        """Move the piece down one row, or lock it if it can't move."""
+        if self.engine.step_down():
+            self.needs_draw = True
+            return
+        level = self.engine.level
+        self.engine.lock_piece()
+        self.after_lock(level)
 
-    def collides(self, x, y, r):
-        """Return True if piece at (x,y,r) would overlap walls or settled blocks."""
-        mat = self.shape_matrix(self.current['type'], r)
-        for i, row in enumerate(mat):
-            for j, cell in enumerate(row):
-                if not cell:
-                    continue
-                gx, gy = x + j, y + i
-                if gx < 0 or gx >= self.COLS or gy < 0 or gy >= self.ROWS:
-                    return True
-                if self.grid[gy][gx] is not None:
-                    return True
-        return False
-
-    def lock_piece(self):
+    # -------------------- Lock / Spawn Feedback --------------------
+    def after_lock(self, old_level):
         """
-        Merge active piece into the grid, clear lines, update score/level, then spawn next.
-
-        LEVEL-AWARE SCORING:
-        - Line clear points are multiplied by current level.
-        - Gravity speeds up ~40ms per level (min 80ms).
+        Show the results of a lock: level up (gravity speeds up ~40ms per
+        level, min 80ms), the next piece, game over, new stats.
         """
-        t = self.current['type']
-        col = self.COLORS[t]
-        mat = self.shape_matrix(t, self.current['rot'])
+        if self.engine.level != old_level:
+            self.gravity = tetris_engine.gravity_ms(self.engine.level)
+            self.status_var.set(f"Level up! Level {self.engine.level}")
+        self.after_spawn()
+        self.needs_draw = True
 
-        # Paint current piece onto the grid
-        for i, row in enumerate(mat):
-            for j, cell in enumerate(row):
-                if cell:
-                    gx, gy = self.current['x'] + j, self.current['y'] + i
-                    if 0 <= gy < self.ROWS and 0 <= gx < self.COLS:
-                        self.grid[gy][gx] = col
-
-        # Clear complete lines and award points (with level multiplier)
-        lines = self.clear_lines()
-        if lines:
-            self.lines_cleared += lines
-            self.score += self.LINE_POINTS[lines] * self.level
-            # Level up every 10 lines; speed up gravity but never below 80ms
-            new_level = 1 + self.lines_cleared // 10
-            if new_level != self.level:
-                self.level = new_level
-                self.gravity = max(80, self.TICK_MS - (self.level - 1) * 40)
-                self.status_var.set(f"Level up! Level {self.level}")
-
-        self.spawn_new_piece()
+    def after_spawn(self):
+        if self.game_over:
+            self.set_title("Game Over! Press Restart.")
+            self.status_var.set("Game Over.")
         self.update_side()
-        self.draw()
 
-    def clear_lines(self):
-        """Remove filled rows and return how many were cleared."""
-        kept = [row for row in self.grid if any(cell is None for cell in row)]
-        cleared = self.ROWS - len(kept)
-        for _ in range(cleared):
-            kept.insert(0, [None] * self.COLS)  # add empty rows at top
-        self.grid = kept
-        return cleared
+    def shape_matrix(self, t, r):
+        return self.SHAPES[t][r]
 
     # -------------------- Rendering --------------------
-    def draw(self):
-        self.canvas.delete("all")
-        # Draw background grid and settled blocks
+    # Every board and preview cell is a canvas item created once. A frame
+    # works out the fill of every cell, diffs it against the previous frame
+    # and only reconfigures the cells that changed, so a move costs a handful
+    # of Tk calls instead of deleting and re-creating 200+ rectangles.
+    def create_cell_items(self):
+        """Create the persistent canvas items for the board and the preview."""
+        self.block_items = []  # row-major: one filled rectangle per board cell
+        self.flash_items = []  # row-major: rotation-flash outline per board cell
         for r in range(self.ROWS):
             for c in range(self.COLS):
                 x1 = c * self.CELL; y1 = r * self.CELL
                 x2 = x1 + self.CELL; y2 = y1 + self.CELL
-                self.canvas.create_rectangle(x1, y1, x2, y2, outline="#333", fill="#111")
-                if self.grid[r][c]:
-                    self.canvas.create_rectangle(x1 + 1, y1 + 1, x2 - 1, y2 - 1,
-                                                 outline="", fill=self.grid[r][c])
-
-        # Draw active piece
-        t = self.current['type']
-        col = self.COLORS[t]
-        mat = self.shape_matrix(t, self.current['rot'])
+                self.canvas.create_rectangle(x1, y1, x2, y2, outline=self.GRID_LINE, fill=self.BOARD_BG)
+                self.block_items.append(self.canvas.create_rectangle(
+                    x1 + 1, y1 + 1, x2 - 1, y2 - 1, outline="", fill=self.BOARD_BG))
+                self.flash_items.append(self.canvas.create_rectangle(
+                    x1 + 3, y1 + 3, x2 - 3, y2 - 3, outline=""))
+
+        # Preview: a 4x4 block of cells per slot, offset by one cell, with
+        # slot k starting k * PREVIEW_SLOT_ROWS cells down
+        self.preview_items = []  # [slot][i * 4 + j]
+        for k in range(self.PREVIEW_SLOTS):
+            items = []
+            for i in range(4):
+                for j in range(4):
+                    x1 = (1 + j) * self.CELL
+                    y1 = (1 + k * self.PREVIEW_SLOT_ROWS + i) * self.CELL
+                    items.append(self.preview_canvas.create_rectangle(
+                        x1 + 1, y1 + 1, x1 + self.CELL - 1, y1 + self.CELL - 1,
+                        outline="", fill=self.PREVIEW_BG))
+            self.preview_items.append(items)
+
+        # What is currently on screen; None forces the first frame to paint all
+        self.drawn_fills = [None] * (self.ROWS * self.COLS)
+        self.drawn_flash = [False] * (self.ROWS * self.COLS)
+        self.drawn_preview = [None] * self.PREVIEW_SLOTS
+
+        # Frame timing (see frame_stats)
+        self.frame_count = 0
+        self.frame_time = 0.0
+        self.frame_time_max = 0.0
+        self.frame_cells = 0
+
+    def draw(self):
+        start = time.perf_counter()
+
+        # Desired fill of every board cell: settled blocks...
+        colors = self.COLORS
+        fills = [colors[t] if t else self.BOARD_BG for row in self.engine.cells for t in row]
+        flash = [False] * len(fills)
+
+        # ...then the active piece on top
+        current = self.engine.current
+        t = current['type']
+        col = colors[t]
+        mat = self.shape_matrix(t, current['rot'])
         for i, row in enumerate(mat):
             for j, cell in enumerate(row):
                 if not cell:
                     continue
-                gx = self.current['x'] + j
-                gy = self.current['y'] + i
+                gx = current['x'] + j
+                gy = current['y'] + i
                 if 0 <= gx < self.COLS and 0 <= gy < self.ROWS:
-                    x1 = gx * self.CELL; y1 = gy * self.CELL
-                    x2 = x1 + self.CELL; y2 = y1 + self.CELL
-                    self.canvas.create_rectangle(x1 + 1, y1 + 1, x2 - 1, y2 - 1,
-                                                 outline="", fill=col)
+                    fills[gy * self.COLS + gx] = col
                     # Thin outline flash after a rotation so you can SEE the event
-                    if self.rotate_flash > 0:
-                        self.canvas.create_rectangle(x1 + 3, y1 + 3, x2 - 3, y2 - 3,
-                                                     outline="#FFF")
+                    flash[gy * self.COLS + gx] = self.rotate_flash > 0
+
+        # Only touch the cells that changed since the last frame
+        changed = 0
+        drawn_fills, drawn_flash = self.drawn_fills, self.drawn_flash
+        for idx, fill in enumerate(fills):
+            if fill != drawn_fills[idx]:
+                self.canvas.itemconfigure(self.block_items[idx], fill=fill)
+                drawn_fills[idx] = fill
+                changed += 1
+            if flash[idx] != drawn_flash[idx]:
+                self.canvas.itemconfigure(self.flash_items[idx],
+                                          outline=self.FLASH_OUTLINE if flash[idx] else "")
+                drawn_flash[idx] = flash[idx]
+                changed += 1
+
+        elapsed = time.perf_counter() - start
+        self.frame_count += 1
+        self.frame_time += elapsed
+        self.frame_time_max = max(self.frame_time_max, elapsed)
+        self.frame_cells += changed
+
+    def frame_stats(self):
+        """Average/max draw() time in ms and average canvas items updated per frame."""
+        n = max(1, self.frame_count)
+        return {
+            "frames": self.frame_count,
+            "avg_ms": self.frame_time * 1000 / n,
+            "max_ms": self.frame_time_max * 1000,
+            "cells_per_frame": self.frame_cells / n,
+        }
 
     def update_side(self):
-        self.score_var.set(f"Score: {self.score}")
-        self.level_var.set(f"Level: {self.level}")
-        self.lines_var.set(f"Lines: {self.lines_cleared}")
-
-        # Draw the next 3 pieces stacked in the preview canvas.
-        # Each block gets a 6xCELL tall area; we offset each by k * 6*CELL.
-        self.preview_canvas.delete("all")
-        for k, piece in enumerate(self.next_queue[:3]):
+        self.score_var.set(f"Score: {self.engine.score}")
+        self.level_var.set(f"Level: {self.engine.level}")
+        self.lines_var.set(f"Lines: {self.engine.lines_cleared}")
+
+        # Repaint only the preview slots whose piece changed
+        for k, piece in enumerate(self.engine.next_queue[:self.PREVIEW_SLOTS]):
             t = piece['type']
+            if self.drawn_preview[k] == t:
+                continue
+            self.drawn_preview[k] = t
             col = self.COLORS[t]
             mat = self.shape_matrix(t, 0)
-            offx = 1
-            offy = 1 + k * 6  # vertical stack (6 cells tall per preview slot)
-            for i, row in enumerate(mat):
-                for j, cell in enumerate(row):
-                    if cell:
-                        x1 = (offx + j) * self.CELL
-                        y1 = (offy + i) * self.CELL
-                        x2 = x1 + self.CELL
-                        y2 = y1 + self.CELL
-                        self.preview_canvas.create_rectangle(
-                            x1 + 1, y1 + 1, x2 - 1, y2 - 1, outline="", fill=col
-                        )
+            for i in range(4):
+                for j in range(4):
+                    filled = i < len(mat) and j < len(mat[i]) and mat[i][j]
+                    self.preview_canvas.itemconfigure(
+                        self.preview_items[k][i * 4 + j],
+                        fill=col if filled else self.PREVIEW_BG,
+                    )
+
+    # -------------------- AI Autoplay --------------------
+    def toggle_autoplay(self):
+        self.autoplay = not self.autoplay
+        if self.autoplay and self.autoplayer is None:
+            self.autoplayer = tetris_ai.AutoPlayer(workers=self.AUTOPLAY_WORKERS)
+        self.status_var.set("Autoplay on" if self.autoplay else "Autoplay off")
+        self.schedule_autoplay()
+
+    def schedule_autoplay(self):
+        if self.autoplay_job is not None:
+            self.root.after_cancel(self.autoplay_job)
+            self.autoplay_job = None
+        if self.autoplay and not self.game_over:
+            self.autoplay_job = self.root.after(self.AUTOPLAY_MS, self.autoplay_step)
+
+    def autoplay_step(self):
+        """Let the AI place the current piece (looking at next_queue), then reschedule."""
+        self.autoplay_job = None
+        if not self.autoplay or self.game_over:
+            return
+        if not self.paused:
+            rot, x = self.autoplayer.choose(self.engine)
+            level = self.engine.level
+            if self.engine.place(rot, x) is None:
+                self.engine.hard_drop()  # Nothing fits: lock it in place (game over)
+            self.after_lock(level)
+        self.schedule_autoplay()
 
     # -------------------- Misc --------------------
     def set_title(self, msg):
@@ -457,7 +484,11 @@ class Tetris:
         self.status_var.set("Paused" if self.paused else "Running")
 
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if self.autoplayer is not None:
+                self.autoplayer.close()
 
 if __name__ == "__main__":
     Tetris().run()
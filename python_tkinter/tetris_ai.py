@@ -0,0 +1,195 @@
+"""
+Tetris AI: picks a placement (rotation, column) for the current piece by
+trying every rotation x column on the bitboard and scoring the resulting
+boards with the usual heuristics:
+
+    score = -0.51 * aggregate height + 0.76 * lines cleared
+            -0.36 * holes - 0.18 * bumpiness
+
+With a lookahead depth of 2 or more the following pieces from next_queue
+are placed on every candidate board as well, and each candidate keeps the
+best score reachable from it. Those subtrees are independent, so they are
+fanned out across a process pool.
+
+    player = AutoPlayer(depth=2)
+    tetris_engine.play_game(engine, player)   # or player.choose(engine)
+    player.close()
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Local imports
+from tetris_engine import COLS, FULL_ROW, PIECE_MASKS, ROWS
+
+# Heuristic weights (a well-known tuned set for the 4-feature evaluation)
+WEIGHTS = {
+    "height": -0.510066,
+    "lines": 0.760666,
+    "holes": -0.35663,
+    "bumpiness": -0.184483,
+}
+
+DEFAULT_DEPTH = 2
+POOL_CHUNKSIZE = 4  # Subtrees sent to a worker per round trip
+
+
+# -------------------- Board Evaluation --------------------
+def board_features(rows):
+    """Returns (aggregate height, holes, bumpiness) of a bitboard."""
+    heights = [0] * COLS
+    holes = 0
+    seen = 0  # Columns with a block at or above the current row
+    for r, bits in enumerate(rows):
+        new = bits & ~seen
+        if new:
+            height = ROWS - r
+            seen |= new
+            while new:
+                low = new & -new  # Lowest set bit = leftmost new column
+                heights[low.bit_length() - 1] = height
+                new ^= low
+        elif not seen:
+            continue  # Still above the stack
+        # Empty cells under a block seen higher up are holes
+        holes += (seen & ~bits).bit_count()
+    bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+    return sum(heights), holes, bumpiness
+
+
+def evaluate(rows, lines, weights=WEIGHTS):
+    height, holes, bumpiness = board_features(rows)
+    return (
+        weights["height"] * height
+        + weights["lines"] * lines
+        + weights["holes"] * holes
+        + weights["bumpiness"] * bumpiness
+    )
+
+
+# -------------------- Placement Search --------------------
+def collides(rows, shifted, y):
+    """True if the piece rows (already shifted to their column) overlap at row y."""
+    for m in shifted:
+        if rows[y] & m:
+            return True
+        y += 1
+    return False
+
+
+def placements(rows, t, start_y=0):
+    """
+    Yields (rotation, column, new rows, lines cleared) for every way to drop
+    piece t straight down from row start_y (the top, for pieces still in
+    next_queue), the same moves TetrisEngine.place makes.
+    """
+    for rot, (masks, width, height) in enumerate(PIECE_MASKS[t]):
+        if start_y + height > ROWS:
+            continue
+        for x in range(COLS - width + 1):
+            shifted = [mask << x for mask in masks]
+            if collides(rows, shifted, start_y):
+                continue  # Doesn't fit where the piece is now
+            # Drop until the next row down collides or hits the floor
+            y = start_y
+            while y + height < ROWS and not collides(rows, shifted, y + 1):
+                y += 1
+
+            new = list(rows)
+            for i, m in enumerate(shifted):
+                new[y + i] |= m
+            lines = 0
+            if FULL_ROW in new:
+                kept = [bits for bits in new if bits != FULL_ROW]
+                lines = ROWS - len(kept)
+                new = [0] * lines + kept
+            yield rot, x, new, lines
+
+
+def search(rows, pieces, lines=0, weights=WEIGHTS):
+    """
+    Best score reachable by placing pieces (a sequence of types) in order.
+    Returns (score, boards evaluated); score is None if nothing fits.
+    """
+    t, rest = pieces[0], pieces[1:]
+    best = None
+    evaluated = 0
+    for _, _, new, cleared in placements(rows, t):
+        if rest:
+            score, n = search(new, rest, lines + cleared, weights)
+            evaluated += n
+        else:
+            score = evaluate(new, lines + cleared, weights)
+            evaluated += 1
+        if score is not None and (best is None or score > best):
+            best = score
+    return best, evaluated
+
+
+def _search_task(args):
+    """Process pool entry point: search one subtree."""
+    rows, pieces, lines, weights = args
+    return search(rows, pieces, lines, weights)
+
+
+def best_placement(rows, pieces, weights=WEIGHTS, executor=None, start_y=0):
+    """
+    Returns (rotation, column, score, boards evaluated) for the first of
+    pieces, dropped from row start_y, looking ahead through the rest;
+    rotation is None if nothing fits.
+    With an executor the subtree of every candidate runs in the pool.
+    """
+    t, rest = pieces[0], pieces[1:]
+    candidates = list(placements(rows, t, start_y))
+    if not rest:
+        scored = [(evaluate(new, lines, weights), 1) for _, _, new, lines in candidates]
+    else:
+        tasks = [(new, rest, lines, weights) for _, _, new, lines in candidates]
+        if executor is None:
+            scored = list(map(_search_task, tasks))
+        else:
+            scored = list(executor.map(_search_task, tasks, chunksize=POOL_CHUNKSIZE))
+
+    best = (None, None, None)
+    evaluated = 0
+    for (rot, x, _, _), (score, n) in zip(candidates, scored):
+        evaluated += n
+        if score is not None and (best[2] is None or score > best[2]):
+            best = (rot, x, score)
+    return best + (evaluated,)
+
+
+# -------------------- Auto Player --------------------
+class AutoPlayer:
+    """
+    A placement policy for tetris_engine: call it with an engine to get the
+    (rotation, column) for the current piece. depth counts the current
+    piece, so depth=2 also looks at next_queue[0]. workers > 1 searches the
+    lookahead subtrees in a process pool (only used for depth >= 2).
+    """
+
+    def __init__(self, depth=DEFAULT_DEPTH, workers=None, weights=WEIGHTS):
+        self.depth = depth
+        self.weights = weights
+        self.evaluated = 0  # Boards evaluated so far, for benchmarks
+        workers = os.cpu_count() if workers is None else workers
+        self.executor = (
+            ProcessPoolExecutor(max_workers=workers) if depth >= 2 and workers > 1 else None
+        )
+
+    def choose(self, engine):
+        pieces = [engine.current['type']] + [p['type'] for p in engine.next_queue[:self.depth - 1]]
+        rot, x, _, evaluated = best_placement(
+            engine.copy_rows(), pieces, self.weights, self.executor, engine.current['y']
+        )
+        self.evaluated += evaluated
+        if rot is None:
+            return engine.current['rot'], engine.current['x']  # Nothing fits; game over
+        return rot, x
+
+    __call__ = choose
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
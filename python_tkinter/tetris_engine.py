@@ -0,0 +1,453 @@
+"""
+Headless Tetris engine: board, pieces, level-aware piece RNG, scoring and
+levels, with no Tk dependency. tetris.py wraps it with a Tk front end;
+scripts can drive it directly to play thousands of games per second, e.g.
+to balance the level-dependent piece weights.
+
+Run a batch of games with random placements, or with the AI player
+(tetris_ai) and/or from a higher level to see the piece mix at the levels
+being balanced:
+    python python_tkinter/tetris_engine.py --games 2000 --seed 1
+    python python_tkinter/tetris_engine.py --games 20 --policy ai --start-level 5
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+COLS = 10
+ROWS = 20
+TICK_MS = 500          # base gravity (milliseconds between automatic drops)
+MIN_GRAVITY_MS = 80    # gravity never gets faster than this
+GRAVITY_STEP_MS = 40   # gravity speeds up this much per level
+LINES_PER_LEVEL = 10
+QUEUE_SIZE = 3         # upcoming pieces kept in next_queue
+
+# Tetromino definitions as rotation states (1 = filled cell)
+SHAPES = {
+    'I': [
+        [[1,1,1,1]],
+        [[1],[1],[1],[1]],
+    ],
+    'O': [
+        [[1,1],
+         [1,1]]
+    ],
+    'T': [
+        [[0,1,0],
+         [1,1,1]],
+        [[1,0],
+         [1,1],
+         [1,0]],
+        [[1,1,1],
+         [0,1,0]],
+        [[0,1],
+         [1,1],
+         [0,1]],
+    ],
+    'S': [
+        [[0,1,1],
+         [1,1,0]],
+        [[1,0],
+         [1,1],
+         [0,1]],
+    ],
+    'Z': [
+        [[1,1,0],
+         [0,1,1]],
+        [[0,1],
+         [1,1],
+         [1,0]],
+    ],
+    'J': [
+        [[1,0,0],
+         [1,1,1]],
+        [[1,1],
+         [1,0],
+         [1,0]],
+        [[1,1,1],
+         [0,0,1]],
+        [[0,1],
+         [0,1],
+         [1,1]],
+    ],
+    'L': [
+        [[0,0,1],
+         [1,1,1]],
+        [[1,0],
+         [1,0],
+         [1,1]],
+        [[1,1,1],
+         [1,0,0]],
+        [[1,1],
+         [0,1],
+         [0,1]],
+    ],
+}
+PIECE_TYPES = list(SHAPES)
+
+# Base points for line clears (before level multiplier)
+LINE_POINTS = [0, 100, 300, 500, 800]  # 0..4 lines
+
+
+def row_masks(shapes):
+    """
+    Precompute every rotation of every shape as a bitboard piece:
+    (row masks with column j as bit j, width, height).
+    """
+    return {
+        t: [
+            (tuple(sum(1 << j for j, cell in enumerate(row) if cell) for row in mat),
+             len(mat[0]), len(mat))
+            for mat in rotations
+        ]
+        for t, rotations in shapes.items()
+    }
+
+
+# Bitboard: each board row is an int with column c as bit c
+PIECE_MASKS = row_masks(SHAPES)
+FULL_ROW = (1 << COLS) - 1
+
+
+# -------------------- Levels & Piece RNG --------------------
+def piece_weights(level):
+    """
+    Return weights for each piece type based on the level.
+    Slightly favors S/Z/J/L as levels rise; slightly reduces I/O.
+    """
+    L = max(1, level)
+    inc = 1.0 + 0.05 * (L - 1)             # +5% per level for S/Z/J/L
+    dec = max(0.4, 1.1 - 0.03 * (L - 1))   # -3% per level for I/O (min 0.4)
+    return {
+        'I': dec,
+        'O': dec,
+        'T': 1.0,
+        'S': inc,
+        'Z': inc,
+        'J': inc,
+        'L': inc,
+    }
+
+
+def weighted_random_piece(level, rng=random):
+    """Choose the next piece using level-aware weights."""
+    w = piece_weights(level)
+    probs = [w[t] for t in PIECE_TYPES]
+    total = sum(probs)
+    r = rng.uniform(0, total)
+    upto = 0.0
+    for t, p in zip(PIECE_TYPES, probs):
+        if upto + p >= r:
+            return {'type': t, 'rot': 0, 'x': 0, 'y': 0}
+        upto += p
+    return {'type': rng.choice(PIECE_TYPES), 'rot': 0, 'x': 0, 'y': 0}
+
+
+def level_for_lines(lines_cleared, start_level=1):
+    """Level up every LINES_PER_LEVEL lines."""
+    return start_level + lines_cleared // LINES_PER_LEVEL
+
+
+def gravity_ms(level):
+    """Milliseconds between automatic drops at the given level."""
+    return max(MIN_GRAVITY_MS, TICK_MS - (level - 1) * GRAVITY_STEP_MS)
+
+
+# -------------------- Engine --------------------
+class TetrisEngine:
+    """
+    One game of Tetris. The board is a bitboard (self.rows, one int per row)
+    used for every collision and line check, plus self.cells with the piece
+    type of every settled cell (None = empty) for rendering.
+
+    Moves return whether they happened; the caller decides what to show.
+    Pass a seed (or an rng) to make the piece sequence reproducible.
+    """
+
+    def __init__(self, seed=None, rng=None, start_level=1):
+        self.rng = rng or random.Random(seed)
+        self.start_level = start_level
+        self.reset()
+
+    def reset(self):
+        self.rows = [0] * ROWS
+        self.cells = [[None] * COLS for _ in range(ROWS)]
+        self.score = 0
+        self.lines_cleared = 0
+        self.level = self.start_level
+        self.pieces = 0
+        self.game_over = False
+        self.next_queue = [self.weighted_random_piece() for _ in range(QUEUE_SIZE)]
+        self.spawn_new_piece()  # pulls first item from next_queue
+
+    def copy_rows(self):
+        """A copy of the bitboard, e.g. for AI search."""
+        return list(self.rows)
+
+    # -------------------- Spawning --------------------
+    def piece_weights(self):
+        return piece_weights(self.level)
+
+    def weighted_random_piece(self):
+        return weighted_random_piece(self.level, self.rng)
+
+    def spawn_new_piece(self):
+        """
+        Pull the next piece from the queue, center it based on width,
+        then push a freshly-weighted piece to the end of the queue.
+        Returns False (and sets game_over) if the new piece doesn't fit.
+        """
+        self.current = self.next_queue.pop(0)
+        self.current['rot'] = 0
+
+        # Center horizontally by actual piece width for nicer spawn
+        piece_w = PIECE_MASKS[self.current['type']][0][1]
+        self.current['x'] = (COLS - piece_w) // 2
+        self.current['y'] = 0
+
+        # Refill queue tail
+        self.next_queue.append(self.weighted_random_piece())
+
+        # If we collide at spawn, it's game over
+        if self.collides(self.current['x'], self.current['y'], self.current['rot']):
+            self.game_over = True
+            return False
+        return True
+
+    # -------------------- Movement & Rotation --------------------
+    def rotate(self, dir_):
+        """Rotate current piece with simple wall-kick. dir_=+1 (CW), -1 (CCW)."""
+        t = self.current['type']
+        rot = (self.current['rot'] + dir_) % len(SHAPES[t])
+        # Try in-place, then nudge left/right (naive wall-kick)
+        for dx in (0, -1, 1, -2, 2):
+            if not self.collides(self.current['x'] + dx, self.current['y'], rot):
+                self.current['rot'] = rot
+                self.current['x'] += dx
+                return True
+        return False
+
+    def move(self, dx, dy):
+        """Attempt to move active piece by (dx, dy)."""
+        nx, ny = self.current['x'] + dx, self.current['y'] + dy
+        if not self.collides(nx, ny, self.current['rot']):
+            self.current['x'], self.current['y'] = nx, ny
+            return True
+        return False
+
+    def step_down(self):
+        """Try moving active piece down by 1 row."""
+        return self.move(0, 1)
+
+    def tick(self):
+        """One gravity step; if blocked, lock the piece. Returns lines cleared."""
+        if self.step_down():
+            return 0
+        return self.lock_piece()
+
+    def hard_drop(self):
+        """
+        Instantly drop to the floor and lock; reward small points per row * level.
+        Returns lines cleared.
+        """
+        x, rot = self.current['x'], self.current['rot']
+        dropped = self.drop_y(self.current['type'], rot, x, self.current['y']) - self.current['y']
+        self.current['y'] += dropped
+        if dropped:
+            self.score += dropped * self.level
+        return self.lock_piece()
+
+    def place(self, rot, x):
+        """
+        Put the current piece at rotation rot and column x (straight from its
+        spawn row), then hard drop. Returns lines cleared, or None if the
+        piece doesn't fit there.
+        """
+        if self.collides(x, self.current['y'], rot):
+            return None
+        self.current['rot'], self.current['x'] = rot, x
+        return self.hard_drop()
+
+    # -------------------- Collision / Lock / Clear --------------------
+    def collides(self, x, y, r, t=None):
+        """Return True if piece at (x,y,r) would overlap walls or settled blocks."""
+        masks, width, height = PIECE_MASKS[t or self.current['type']][r]
+        if x < 0 or y < 0 or x + width > COLS or y + height > ROWS:
+            return True
+        rows = self.rows
+        for i, mask in enumerate(masks):
+            if rows[y + i] & (mask << x):
+                return True
+        return False
+
+    def drop_y(self, t, rot, x, y=0):
+        """The row where piece t at (x, rot) lands when dropped from row y."""
+        while not self.collides(x, y + 1, rot, t):
+            y += 1
+        return y
+
+    def lock_piece(self):
+        """
+        Merge active piece into the board, clear lines, update score/level,
+        then spawn next. Returns lines cleared.
+
+        LEVEL-AWARE SCORING:
+        - Line clear points are multiplied by current level.
+        - Gravity speeds up ~40ms per level (see gravity_ms).
+        """
+        t = self.current['type']
+        masks, width, height = PIECE_MASKS[t][self.current['rot']]
+        x, y = self.current['x'], self.current['y']
+
+        # Paint current piece onto the bitboard and the cell grid
+        for i, mask in enumerate(masks):
+            gy = y + i
+            if 0 <= gy < ROWS:
+                self.rows[gy] |= (mask << x) & FULL_ROW
+                cell_row = self.cells[gy]
+                for j in range(width):
+                    if mask >> j & 1 and 0 <= x + j < COLS:
+                        cell_row[x + j] = t
+        self.pieces += 1
+
+        # Clear complete lines and award points (with level multiplier)
+        lines = self.clear_lines()
+        if lines:
+            self.lines_cleared += lines
+            self.score += LINE_POINTS[lines] * self.level
+            self.level = level_for_lines(self.lines_cleared, self.start_level)
+
+        self.spawn_new_piece()
+        return lines
+
+    def clear_lines(self):
+        """Remove filled rows and return how many were cleared."""
+        if FULL_ROW not in self.rows:
+            return 0
+        kept = [r for r, bits in enumerate(self.rows) if bits != FULL_ROW]
+        cleared = ROWS - len(kept)
+        # Add empty rows at top
+        self.rows = [0] * cleared + [self.rows[r] for r in kept]
+        self.cells = [[None] * COLS for _ in range(cleared)] + [self.cells[r] for r in kept]
+        return cleared
+
+
+# -------------------- Batch Simulation --------------------
+AI_MAX_PIECES = 1000  # default game length for the CLI's --policy ai
+
+def random_placement(engine):
+    """Placement policy: a random rotation and a random column that fits."""
+    t, y = engine.current['type'], engine.current['y']
+    fits = [
+        (rot, x)
+        for rot in range(len(SHAPES[t]))
+        for x in range(COLS - PIECE_MASKS[t][rot][1] + 1)
+        if not engine.collides(x, y, rot)
+    ]
+    if not fits:
+        return engine.current['rot'], engine.current['x']  # Nothing fits; game over
+    return engine.rng.choice(fits)
+
+
+def play_piece(engine, policy=random_placement):
+    """
+    Place the current piece where policy(engine) -> (rotation, column) says.
+    Policies only pick placements that fit from the piece's current row, so
+    place() fails only when nothing fits and the piece locks where it is.
+    """
+    rot, x = policy(engine)
+    if engine.place(rot, x) is None:
+        engine.hard_drop()  # Nothing fits: lock it in place (game over)
+
+
+def play_game(engine, policy=random_placement, max_pieces=None):
+    """Play one game to the end (or max_pieces). Returns the engine."""
+    while not engine.game_over and (max_pieces is None or engine.pieces < max_pieces):
+        play_piece(engine, policy)
+    return engine
+
+
+def run_batch(games, seed=None, policy=random_placement, max_pieces=None, start_level=1):
+    """
+    Play games reproducibly from one seed. Returns a summary dict with
+    totals, per-game averages and the pieces played per level.
+    """
+    rng = random.Random(seed)
+    played = {}  # level -> Counter of piece types
+    totals = Counter()
+    max_level = start_level
+    for _ in range(games):
+        engine = TetrisEngine(seed=rng.random(), start_level=start_level)
+        while not engine.game_over and (max_pieces is None or engine.pieces < max_pieces):
+            counts = played.get(engine.level)
+            if counts is None:
+                counts = played[engine.level] = Counter()
+            counts[engine.current['type']] += 1
+            play_piece(engine, policy)
+        totals.update(pieces=engine.pieces, lines=engine.lines_cleared, score=engine.score)
+        max_level = max(max_level, engine.level)
+    return {
+        "games": games,
+        "pieces": totals["pieces"],
+        "avg_pieces": totals["pieces"] / games,
+        "avg_lines": totals["lines"] / games,
+        "avg_score": totals["score"] / games,
+        "max_level": max_level,
+        "played": played,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play headless Tetris games in batch.")
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--policy", choices=("random", "ai"), default="random",
+        help="random placements (games end fast, at level 1) or the depth-1 AI player",
+    )
+    parser.add_argument("--start-level", type=int, default=1)
+    parser.add_argument(
+        "--max-pieces", type=int, default=None,
+        help=f"stop each game after N pieces (default {AI_MAX_PIECES} with --policy ai)",
+    )
+    args = parser.parse_args()
+
+    policy, player = random_placement, None
+    max_pieces = args.max_pieces
+    if args.policy == "ai":
+        import tetris_ai  # Imports this module, so only load it when asked
+        policy = player = tetris_ai.AutoPlayer(depth=1, workers=1)
+        if max_pieces is None:
+            max_pieces = AI_MAX_PIECES  # The AI rarely tops out
+
+    start = time.perf_counter()
+    try:
+        summary = run_batch(args.games, args.seed, policy, max_pieces, args.start_level)
+    finally:
+        if player is not None:
+            player.close()
+    seconds = time.perf_counter() - start
+
+    print(
+        f"{summary['games']:,} games in {seconds:.2f}s "
+        f"({summary['games'] / seconds:,.0f} games/sec, {summary['pieces'] / seconds:,.0f} pieces/sec)"
+    )
+    print(
+        f"  avg pieces {summary['avg_pieces']:.1f}, lines {summary['avg_lines']:.2f}, "
+        f"score {summary['avg_score']:.0f}; max level {summary['max_level']}"
+    )
+    print("  Piece mix by level (observed % / expected %):")
+    for level, counts in sorted(summary["played"].items()):
+        n = sum(counts.values())
+        weights = piece_weights(level)
+        total = sum(weights.values())
+        mix = "  ".join(
+            f"{t} {counts[t] * 100 / n:4.1f}/{weights[t] * 100 / total:4.1f}" for t in PIECE_TYPES
+        )
+        print(f"    level {level:>2} ({n:,} pieces): {mix}")
+
+
+if __name__ == "__main__":
+    main()
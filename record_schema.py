@@ -0,0 +1,132 @@
+"""
+Record schemas: describe the fields of a record once, then compile the
+schema into ONE generated function that parses a whole record.
+
+    schema = RecordSchema([
+        Field("name", "str", required=True, label="Name"),
+        Field("dob", "date", label="Date of Birth"),
+    ])
+    parse = schema.compile()
+    values, errors = parse({"name": " Loc ", "dob": "1980-01-31"})
+
+The compiled function takes a mapping of field name -> text (a dict, a
+csv.DictReader row, ...) and returns (values, errors):
+- values is a tuple in field order; missing or invalid fields are None,
+- errors is a list of (field_name, message) for EVERY bad field.
+
+Text is stripped and empty text counts as missing, so parsers only ever
+see non-empty text. The generated code is straight-line Python with each
+field's parser and validator bound as a local, so there is no per-field
+loop or lookup at parse time.
+"""
+
+import parse_util
+
+# ============================================================
+# PARSER REGISTRY
+# ============================================================
+#
+# name -> parse(text) -> value. A parser gets stripped, non-empty text and
+# raises (usually ValueError) if the text is invalid.
+
+PARSERS = {
+    "str": None,  # Stripped text as is; the compiled code skips the call
+    "code": str.upper,
+    "int": int,
+    "float": float,
+    "bool": parse_util.parse_bool,
+    "date": parse_util.parse_date,
+}
+
+
+def register_parser(name: str, parse):
+    """Adds (or replaces) a named parser usable in Field(parser=name)."""
+    PARSERS[name] = parse
+
+
+def get_parser(name: str):
+    """Returns the parser registered under name. Raises KeyError if unknown."""
+    if name not in PARSERS:
+        raise KeyError(f"Unknown parser {name!r}. Registered: {', '.join(PARSERS)}")
+    return PARSERS[name]
+
+
+# ============================================================
+# SCHEMA
+# ============================================================
+
+
+class Field:
+    """
+    One field of a record.
+
+    - parser: a registered parser name, or any callable text -> value.
+    - required: empty text is an error instead of None.
+    - validator(value) -> bool: extra check on the parsed value.
+    - label: name used in error messages (defaults to the field name).
+    - message: error message when the validator fails.
+    """
+
+    def __init__(self, name, parser="str", required=False, validator=None,
+                 label=None, message=None):
+        self.name = name
+        self.parse = get_parser(parser) if isinstance(parser, str) else parser
+        self.required = required
+        self.validator = validator
+        self.label = label or name
+        self.message = message or f"{self.label} is invalid."
+
+
+class RecordSchema:
+    """An ordered list of Fields that compiles into a record parser."""
+
+    def __init__(self, fields):
+        self.fields = list(fields)
+        self.names = tuple(field.name for field in self.fields)
+        self.source = None  # Generated code, set by compile()
+
+    def compile(self):
+        """Returns parse(record) -> (values, errors); see the module docstring."""
+        lines = ["def parse_record(record):", "    errors = []", "    get = record.get"]
+        namespace = {}
+
+        for i, field in enumerate(self.fields):
+            value = f"v{i}"
+            name = repr(field.name)
+            lines += [
+                f"    # {field.name}",
+                f"    text = get({name})",
+                "    text = text.strip() if text else ''",
+                "    if not text:",
+                f"        {value} = None",
+            ]
+            if field.required:
+                lines.append(f"        errors.append(({name}, {field.label + ' is required.'!r}))")
+
+            lines.append("    else:")
+            if field.parse is None:
+                lines.append(f"        {value} = text")
+            else:
+                namespace[f"parse{i}"] = field.parse
+                lines += [
+                    "        try:",
+                    f"            {value} = parse{i}(text)",
+                    "        except Exception:",
+                    f"            {value} = None",
+                    f"            errors.append(({name}, {field.label + ' is invalid.'!r}))",
+                ]
+
+            if field.validator is not None:
+                namespace[f"valid{i}"] = field.validator
+                lines += [
+                    f"    if {value} is not None and not valid{i}({value}):",
+                    f"        {value} = None",
+                    f"        errors.append(({name}, {field.message!r}))",
+                ]
+
+        values = ", ".join(f"v{i}" for i in range(len(self.fields)))
+        lines.append(f"    return ({values}{',' if len(self.fields) == 1 else ''}), errors")
+
+        self.source = "\n".join(lines)
+        exec(compile(self.source, "<record_schema>", "exec"), namespace)
+        return namespace["parse_record"]